@@ -1,8 +1,8 @@
 """Cloudknot is a python library to run your existing code on AWS Batch."""
-import errno
+import copy
 import logging
+import logging.handlers
 import os
-import subprocess
 
 from . import aws  # noqa
 from . import config  # noqa
@@ -15,18 +15,29 @@ from .cloudknot import *  # noqa
 from .dockerimage import *  # noqa
 from ._version import version as __version__  # noqa
 
-try:
-    fnull = open(os.devnull, "w")
-    subprocess.check_call(
-        "docker version", shell=True, stdout=fnull, stderr=subprocess.STDOUT
-    )
-except subprocess.CalledProcessError:
-    raise ImportError(
-        "It looks like you don't have Docker installed or running. Please go "
-        "to https://docs.docker.com/engine/installation/ to install it. Once "
-        "installed, make sure that the Docker daemon is running before using "
-        "cloudknot."
-    )
+
+class _LazyRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that creates its directory on first write."""
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super(_LazyRotatingFileHandler, self)._open()
+
+
+class _BufferingHandler(logging.handlers.MemoryHandler):
+    """Memory handler that formats each record's message as it arrives.
+
+    Buffered records are written later, by which time objects passed as
+    lazy %-style arguments may have changed. Merging the arguments into the
+    message up front makes the log show the values at the time of the call.
+    """
+
+    def emit(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        super(_BufferingHandler, self).emit(record)
+
 
 module_logger = logging.getLogger(__name__)
 
@@ -37,29 +48,40 @@ if "CLOUDKNOT_LOGLEVEL" in os.environ:
 else:
     module_logger.setLevel(logging.WARNING)
 
-# create a file handler
-logpath = os.path.join(os.path.expanduser("~"), ".cloudknot", "cloudknot.log")
-
-# Create the config directory if it doesn't exist
-logdir = os.path.dirname(logpath)
-try:
-    os.makedirs(logdir)
-except OSError as e:
-    pre_existing = e.errno == errno.EEXIST and os.path.isdir(logdir)
-    if pre_existing:
-        pass
-    else:  # pragma: nocover
-        raise e
-
-handler = logging.FileHandler(logpath, mode="w")
-handler.setLevel(logging.DEBUG)
-
-# create a logging format
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-handler.setFormatter(formatter)
-
-# add the handlers to the logger
-module_logger.addHandler(handler)
+# Write a log file in ~/.cloudknot unless the user has turned it off
+if os.environ.get("CLOUDKNOT_LOGFILE", "").lower() != "off":
+    logpath = os.path.join(os.path.expanduser("~"), ".cloudknot", "cloudknot.log")
+
+    # Append rather than truncate so that concurrent cloudknot processes
+    # don't clobber each other's logs. delay=True postpones creating the log
+    # directory and opening the file until the first record is emitted.
+    handler = _LazyRotatingFileHandler(
+        logpath, mode="a", maxBytes=5000000, backupCount=3, delay=True
+    )
+    handler.setLevel(logging.DEBUG)
+
+    # create a logging format
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    handler.setFormatter(formatter)
+
+    # buffer records in memory and write them to the log file in small
+    # batches. Anything at WARNING or above is flushed immediately and the
+    # buffer is drained by logging.shutdown() at interpreter exit. If the
+    # process is killed, at most the last few buffered records are lost.
+    mem_handler = _BufferingHandler(
+        capacity=64, flushLevel=logging.WARNING, target=handler, flushOnClose=True
+    )
+
+    # flush before forking so that child processes don't inherit (and later
+    # re-emit) buffered records
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(before=mem_handler.flush)
+
+    # add the handlers to the logger
+    module_logger.addHandler(mem_handler)
+
 module_logger.info("Started new cloudknot session")
 
 logging.getLogger("boto").setLevel(logging.WARNING)
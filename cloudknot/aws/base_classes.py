@@ -1,18 +1,21 @@
-import boto3
 import botocore
+import botocore.credentials
 import configparser
+import functools
 import json
 import logging
 import os
 import re
+import threading
+import time
 import uuid
 
-try:
-    from collections.abc import namedtuple
-except ImportError:
-    from collections import namedtuple
+from collections import namedtuple
+from collections.abc import ItemsView, KeysView, ValuesView
+from itertools import chain
+from operator import itemgetter
 
-from ..config import get_config_file, rlock
+from ..config import get_config_file, read_config, rlock, write_config
 
 __all__ = [
     "clients",
@@ -43,41 +46,52 @@ __all__ = [
 ]
 mod_logger = logging.getLogger(__name__)
 
+#: keys of a tag dict in the AWS list-of-dicts tag format
+_TAG_KEYS = frozenset(["Key", "Value"])
+
 
 def get_tags(name, additional_tags=None):
+    if additional_tags is None:
+        # Nothing to merge, so build the default tags directly
+        return [
+            {"Key": "Name", "Value": name},
+            {"Key": "Owner", "Value": get_user()},
+            {"Key": "Environment", "Value": "cloudknot"},
+        ]
+
     tag_list = []
-    if additional_tags is not None:
-        if isinstance(additional_tags, list):
-            if not all(
-                [set(item.keys()) == set(["Key", "Value"]) for item in additional_tags]
-            ):
-                raise ValueError(
-                    "If additional_tags is a list, it must be a list of "
-                    "dictionaries of the form {'Key': key_val, 'Value': "
-                    "value_val}."
-                )
-            tag_list += additional_tags
-        elif isinstance(additional_tags, dict):
-            if "Key" in additional_tags.keys() or "Value" in additional_tags.keys():
-                raise ValueError(
-                    "If additional_tags is a dict, it cannot contain keys named 'Key' or "
-                    "'Value'. It looks like you are trying to pass in tags of the form "
-                    "{'Key': key_val, 'Value': value_val}. If that's the case, please put "
-                    "it in a list, i.e. [{'Key': key_val, 'Value': value_val}]."
-                )
-            tag_list = [{"Key": k, "Value": v} for k, v in additional_tags.items()]
-        else:
+    if isinstance(additional_tags, list):
+        if not all(item.keys() == _TAG_KEYS for item in additional_tags):
+            raise ValueError(
+                "If additional_tags is a list, it must be a list of "
+                "dictionaries of the form {'Key': key_val, 'Value': "
+                "value_val}."
+            )
+        tag_list += additional_tags
+    elif isinstance(additional_tags, dict):
+        if "Key" in additional_tags.keys() or "Value" in additional_tags.keys():
             raise ValueError(
-                "additional_tags must be a dictionary or a list of dictionaries."
+                "If additional_tags is a dict, it cannot contain keys named 'Key' or "
+                "'Value'. It looks like you are trying to pass in tags of the form "
+                "{'Key': key_val, 'Value': value_val}. If that's the case, please put "
+                "it in a list, i.e. [{'Key': key_val, 'Value': value_val}]."
             )
+        tag_list = [{"Key": k, "Value": v} for k, v in additional_tags.items()]
+    else:
+        raise ValueError(
+            "additional_tags must be a dictionary or a list of dictionaries."
+        )
 
-    if not [tag for tag in tag_list if tag["Key"] == "Name"]:
+    # Collect the user-supplied keys once rather than scanning per default
+    keys = {tag["Key"] for tag in tag_list}
+
+    if "Name" not in keys:
         tag_list.append({"Key": "Name", "Value": name})
 
-    if not [tag for tag in tag_list if tag["Key"] == "Owner"]:
+    if "Owner" not in keys:
         tag_list.append({"Key": "Owner", "Value": get_user()})
 
-    if not [tag for tag in tag_list if tag["Key"] == "Environment"]:
+    if "Environment" not in keys:
         tag_list.append({"Key": "Environment", "Value": "cloudknot"})
 
     return tag_list
@@ -95,11 +109,8 @@ def get_ecr_repo():
     repo : string
         Cloudknot ECR repository name
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         option = "ecr-repo"
         if config.has_section("aws") and config.has_option("aws", option):
@@ -131,46 +142,45 @@ def set_ecr_repo(repo):
         Cloudknot ECR repo name
     """
     # Update the config file
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         if not config.has_section("aws"):  # pragma: nocover
             config.add_section("aws")
 
         config.set("aws", "ecr-repo", repo)
-        with open(config_file, "w") as f:
-            config.write(f)
-
-        # Flake8 will see that repo_arn is set in the try/except clauses
-        # and claim that we are referencing it before assignment below
-        # so we predefine it here. Also, it should be predefined as a
-        # string to pass parameter validation by boto.
-        repo_arn = "test"
+        write_config(config)
+
+        tags = get_tags(
+            name=repo, additional_tags={"Project": "Cloudknot global config"}
+        )
+
         try:
             # If repo exists, retrieve its info
             response = clients["ecr"].describe_repositories(repositoryNames=[repo])
             repo_arn = response["repositories"][0]["repositoryArn"]
-        except clients["ecr"].exceptions.RepositoryNotFoundException:
-            # If it doesn't exists already, then create it
-            response = clients["ecr"].create_repository(repositoryName=repo)
-            repo_arn = response["repository"]["repositoryArn"]
         except botocore.exceptions.ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "RepositoryNotFoundException":
-                # If it doesn't exist already, then create it
-                response = clients["ecr"].create_repository(repositoryName=repo)
-                repo_arn = response["repository"]["repositoryArn"]
+            # The modeled RepositoryNotFoundException is a ClientError subclass
+            if e.response["Error"]["Code"] != "RepositoryNotFoundException":
+                raise e
 
+            # If it doesn't exist already, then create it, tagged on creation
+            clients["ecr"].create_repository(repositoryName=repo, tags=tags)
+            return
+
+        # The repo already existed. Only tag it if some of the cloudknot tags
+        # are missing, which saves a round trip on the common path.
         try:
-            clients["ecr"].tag_resource(
-                resourceArn=repo_arn,
-                tags=get_tags(
-                    name=repo, additional_tags={"Project": "Cloudknot global config"}
-                ),
-            )
+            existing = clients["ecr"].list_tags_for_resource(resourceArn=repo_arn)
+            existing = set(map(itemgetter("Key", "Value"), existing["tags"]))
+        except (botocore.exceptions.ClientError, NotImplementedError):
+            existing = set()
+
+        if set(map(itemgetter("Key", "Value"), tags)) <= existing:
+            return
+
+        try:
+            clients["ecr"].tag_resource(resourceArn=repo_arn, tags=tags)
         except NotImplementedError as e:
             moto_msg = "The tag_resource action has not been implemented"
             if moto_msg in e.args:
@@ -182,6 +192,72 @@ def set_ecr_repo(repo):
                 raise e
 
 
+#: valid S3 server-side encryption methods
+_VALID_SSE = frozenset(["AES256", "aws:kms"])
+
+#: valid values of the s3-sse option in the cloudknot config file
+_VALID_SSE_WITH_NONE = _VALID_SSE | {"None"}
+
+#: S3 error codes raised when a bucket's region does not match the client's
+_LOCATION_ERROR_CODES = frozenset(
+    ["IllegalLocationConstraintException", "InvalidLocationConstraint"]
+)
+
+#: seconds for which a listing of the cloudknot IAM policies is reused
+_POLICY_CACHE_TTL = 60
+
+#: cached {PolicyName: Arn} listings, keyed on profile
+_policy_cache = {}
+
+#: seconds for which a verified bucket and policy are trusted to still exist
+_S3_PARAMS_TTL = 60
+
+#: monotonic times at which S3 params were last verified, keyed on
+#: (profile, bucket, policy, sse)
+_verified_s3_params = {}
+
+
+def _cloudknot_policies(required=None):
+    """Return the local IAM policies under the /cloudknot/ path
+
+    Listing the policies takes one or more paginated IAM calls, so the
+    result is reused for _POLICY_CACHE_TTL seconds. The policies are listed
+    again if `required` is missing from the cached listing, e.g. because it
+    was just created.
+
+    Parameters
+    ----------
+    required : string, optional
+        Name of a policy that the returned listing must contain if it exists
+
+    Returns
+    -------
+    aws_policies : dict
+        Mapping from policy name to policy ARN
+    """
+    profile = get_profile()
+    cached = _policy_cache.get(profile)
+    if (
+        cached is not None
+        and time.monotonic() - cached[0] < _POLICY_CACHE_TTL
+        and (required is None or required in cached[1])
+    ):
+        return cached[1]
+
+    # Get all local policies with cloudknot prefix
+    paginator = clients["iam"].get_paginator("list_policies")
+    response_iterator = paginator.paginate(Scope="Local", PathPrefix="/cloudknot/")
+
+    # Chain the pages together rather than building a list of lists
+    aws_policies = {
+        d["PolicyName"]: d["Arn"]
+        for d in chain.from_iterable(r["Policies"] for r in response_iterator)
+    }
+
+    _policy_cache[profile] = (time.monotonic(), aws_policies)
+    return aws_policies
+
+
 def get_s3_params():
     """Get the cloudknot S3 bucket and corresponding access policy
 
@@ -201,13 +277,10 @@ def get_s3_params():
     bucket : NamedTuple
         A namedtuple with fields ['bucket', 'policy', 'policy_arn', 'sse']
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     BucketInfo = namedtuple("BucketInfo", ["bucket", "policy", "policy_arn", "sse"])
 
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         option = "s3-bucket-policy"
         if config.has_section("aws") and config.has_option("aws", option):
@@ -238,7 +311,7 @@ def get_s3_params():
         option = "s3-sse"
         if config.has_section("aws") and config.has_option("aws", option):
             sse = config.get("aws", option)
-            if sse not in ["AES256", "aws:kms", "None"]:
+            if sse not in _VALID_SSE_WITH_NONE:
                 raise CloudknotInputError(
                     'The server-side encryption option "sse" must must be '
                     'one of ["AES256", "aws:kms", "None"]'
@@ -252,24 +325,10 @@ def get_s3_params():
         # Use set_s3_params to check for name availability
         # and write to config file
         bucket = bucket.replace("_", "-")  # S3 does not allow underscores
-        set_s3_params(bucket=bucket, policy=policy, sse=sse)
+        # set_s3_params returns the policy name, including a newly created one
+        policy = set_s3_params(bucket=bucket, policy=policy, sse=sse)
 
-        if policy is None:
-            config.read(config_file)
-            policy = config.get("aws", "s3-bucket-policy")
-
-    # Get all local policies with cloudknot prefix
-    paginator = clients["iam"].get_paginator("list_policies")
-    response_iterator = paginator.paginate(Scope="Local", PathPrefix="/cloudknot/")
-
-    # response_iterator is a list of dicts. First convert to list of lists
-    # and then flatten to a single list
-    response_policies = [response["Policies"] for response in response_iterator]
-    policies = [lst for sublist in response_policies for lst in sublist]
-
-    aws_policies = {d["PolicyName"]: d["Arn"] for d in policies}
-
-    policy_arn = aws_policies[policy]
+    policy_arn = _cloudknot_policies(required=policy)[policy]
 
     return BucketInfo(bucket=bucket, policy=policy, policy_arn=policy_arn, sse=sse)
 
@@ -290,17 +349,19 @@ def set_s3_params(bucket, policy=None, sse=None):
         S3 server side encryption method. If provided, must be one of
         ['AES256', 'aws:kms'].
         Default: None
+
+    Returns
+    -------
+    policy : string
+        Name of the S3 bucket access policy, which is newly created if
+        `policy` was None
     """
-    if sse is not None and sse not in ["AES256", "aws:kms"]:
+    if sse is not None and sse not in _VALID_SSE:
         raise CloudknotInputError(
             'The server-side encryption option "sse" '
             'must be one of ["AES256", "aws:kms"]'
         )
 
-    # Update the config file
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     def test_bucket_put_get(bucket_, sse_):
         key = "cloudnot-test-permissions-key"
         try:
@@ -325,14 +386,21 @@ def set_s3_params(bucket, policy=None, sse=None):
             pass
 
     with rlock:
-        config.read(config_file)
-
-        if not config.has_section("aws"):  # pragma: nocover
-            config.add_section("aws")
-
-        config.set("aws", "s3-bucket", bucket)
-
-        # Create the bucket
+        # Skip the AWS calls below if this bucket and policy were set up
+        # moments ago, e.g. by an earlier get_s3_params() in this session
+        key = (get_profile(), bucket, policy, sse)
+        verified = _verified_s3_params.get(key)
+        if (
+            policy is not None
+            and verified is not None
+            and time.monotonic() - verified < _S3_PARAMS_TTL
+        ):
+            _write_s3_config(bucket, policy, sse)
+            return policy
+
+        # Create the bucket. In us-east-1, create_bucket succeeds for a
+        # bucket that we already own instead of raising, so it may be old.
+        owned = get_region() == "us-east-1"
         try:
             if get_region() == "us-east-1":
                 clients["s3"].create_bucket(Bucket=bucket)
@@ -342,16 +410,13 @@ def set_s3_params(bucket, policy=None, sse=None):
                     CreateBucketConfiguration={"LocationConstraint": get_region()},
                 )
         except clients["s3"].exceptions.BucketAlreadyOwnedByYou:
-            pass
+            owned = True
         except clients["s3"].exceptions.BucketAlreadyExists:
             test_bucket_put_get(bucket, sse)
         except clients["s3"].exceptions.ClientError as e:
             # Check for Illegal Location Constraint
             error_code = e.response["Error"]["Code"]
-            if error_code in [
-                "IllegalLocationConstraintException",
-                "InvalidLocationConstraint",
-            ]:
+            if error_code in _LOCATION_ERROR_CODES:
                 response = clients["s3"].get_bucket_location(Bucket=bucket)
                 location = response.get("LocationConstraint")
                 try:
@@ -363,44 +428,78 @@ def set_s3_params(bucket, policy=None, sse=None):
                             CreateBucketConfiguration={"LocationConstraint": location},
                         )
                 except clients["s3"].exceptions.BucketAlreadyOwnedByYou:
-                    pass
+                    owned = True
                 except clients["s3"].exceptions.BucketAlreadyExists:
                     test_bucket_put_get(bucket, sse)
             else:
                 # Pass exception to user
                 raise e
 
-        # Add the cloudknot tags to the bucket
-        clients["s3"].put_bucket_tagging(
-            Bucket=bucket,
-            Tagging={
-                "TagSet": get_tags(
-                    name=bucket, additional_tags={"Project": "Cloudknot global config"}
-                )
-            },
+        # Add the cloudknot tags to the bucket, unless a bucket that we
+        # already owned carries them from an earlier run
+        tags = get_tags(
+            name=bucket, additional_tags={"Project": "Cloudknot global config"}
         )
+        existing = set()
+        if owned:
+            try:
+                response = clients["s3"].get_bucket_tagging(Bucket=bucket)
+                existing = set(map(itemgetter("Key", "Value"), response["TagSet"]))
+            except clients["s3"].exceptions.ClientError:
+                # NoSuchTagSet: the bucket has no tags at all
+                pass
+
+        if not set(map(itemgetter("Key", "Value"), tags)) <= existing:
+            # put_bucket_tagging replaces the whole tag set, so carry over
+            # the bucket's other tags rather than wiping them
+            keys = {tag["Key"] for tag in tags}
+            tags += [
+                {"Key": k, "Value": v} for k, v in sorted(existing) if k not in keys
+            ]
+            clients["s3"].put_bucket_tagging(Bucket=bucket, Tagging={"TagSet": tags})
 
         if policy is None:
             policy = "cloudknot-bucket-access-" + str(uuid.uuid4())
 
         try:
             # Create the policy
-            s3_policy_doc = bucket_policy_document(bucket)
+            s3_policy_json = _bucket_policy_json(bucket)
 
             clients["iam"].create_policy(
                 PolicyName=policy,
                 Path="/cloudknot/",
-                PolicyDocument=json.dumps(s3_policy_doc),
+                PolicyDocument=s3_policy_json,
                 Description="Grants access to S3 bucket {0:s}" "".format(bucket),
             )
         except clients["iam"].exceptions.EntityAlreadyExistsException:
             # Policy already exists, do nothing
             pass
 
-        config.set("aws", "s3-bucket-policy", policy)
-        config.set("aws", "s3-sse", str(sse))
-        with open(config_file, "w") as f:
-            config.write(f)
+        # Update the config file only once the bucket and policy exist, so
+        # that a failure above leaves the cached config untouched
+        _write_s3_config(bucket, policy, sse)
+        _verified_s3_params[(key[0], bucket, policy, sse)] = time.monotonic()
+
+    return policy
+
+
+def _write_s3_config(bucket, policy, sse):
+    """Record the S3 params in the config file, unless they are already there"""
+    values = {"s3-bucket": bucket, "s3-bucket-policy": policy, "s3-sse": str(sse)}
+
+    with rlock:
+        config = read_config()
+
+        if not config.has_section("aws"):  # pragma: nocover
+            config.add_section("aws")
+
+        if all(config.get("aws", k, fallback=None) == v for k, v in values.items()):
+            return
+
+        for option, value in values.items():
+            config.set("aws", option, value)
+
+        write_config(config)
 
 
 def bucket_policy_document(bucket):
@@ -436,6 +535,22 @@ def bucket_policy_document(bucket):
     return s3_policy_doc
 
 
+_BUCKET_PLACEHOLDER = "__cloudknot_bucket__"
+
+#: JSON policy document for a placeholder bucket name. Only the bucket name
+#: varies, so we serialize the document once and substitute the name.
+_S3_POLICY_JSON = json.dumps(bucket_policy_document(_BUCKET_PLACEHOLDER))
+
+
+def _bucket_policy_json(bucket):
+    """Return the JSON policy document to access an S3 bucket
+
+    This is equivalent to ``json.dumps(bucket_policy_document(bucket))``.
+    """
+    # json.dumps escapes the name; strip the quotes that it adds
+    return _S3_POLICY_JSON.replace(_BUCKET_PLACEHOLDER, json.dumps(bucket)[1:-1])
+
+
 def update_s3_policy(policy, bucket):
     """Update the cloudknot S3 access policy with new bucket name
 
@@ -447,27 +562,16 @@ def update_s3_policy(policy, bucket):
     bucket: string
         Amazon S3 bucket name
     """
-    s3_policy_doc = bucket_policy_document(bucket)
-
-    # Get all local policies with cloudknot prefix
-    paginator = clients["iam"].get_paginator("list_policies")
-    response_iterator = paginator.paginate(Scope="Local", PathPrefix="/cloudknot/")
-
-    # response_iterator is a list of dicts. First convert to list of lists
-    # and then flatten to a single list
-    response_policies = [response["Policies"] for response in response_iterator]
-    policies = [lst for sublist in response_policies for lst in sublist]
+    s3_policy_json = _bucket_policy_json(bucket)
 
-    aws_policies = {d["PolicyName"]: d["Arn"] for d in policies}
-
-    arn = aws_policies[policy]
+    arn = _cloudknot_policies(required=policy)[policy]
 
     with rlock:
         try:
             # Update the policy
             clients["iam"].create_policy_version(
                 PolicyArn=arn,
-                PolicyDocument=json.dumps(s3_policy_doc),
+                PolicyDocument=s3_policy_json,
                 SetAsDefault=True,
             )
         except clients["iam"].exceptions.LimitExceededException:
@@ -476,14 +580,14 @@ def update_s3_policy(policy, bucket):
             response_iterator = paginator.paginate(PolicyArn=arn)
 
             # Get non-default versions
-            # response_iterator is a list of dicts. First convert to list of
-            # lists. Then flatten to a single list and filter
-            response_versions = [response["Versions"] for response in response_iterator]
-            versions = [lst for sublist in response_versions for lst in sublist]
-            versions = [v for v in versions if not v["IsDefaultVersion"]]
+            versions = [
+                v
+                for v in chain.from_iterable(r["Versions"] for r in response_iterator)
+                if not v["IsDefaultVersion"]
+            ]
 
             # Get the oldest version and delete it
-            oldest = sorted(versions, key=lambda ver: ver["CreateDate"])[0]
+            oldest = min(versions, key=itemgetter("CreateDate"))
             clients["iam"].delete_policy_version(
                 PolicyArn=arn, VersionId=oldest["VersionId"]
             )
@@ -491,7 +595,7 @@ def update_s3_policy(policy, bucket):
             # Update the policy not that there's room for another version
             clients["iam"].create_policy_version(
                 PolicyArn=arn,
-                PolicyDocument=json.dumps(s3_policy_doc),
+                PolicyDocument=s3_policy_json,
                 SetAsDefault=True,
             )
 
@@ -509,11 +613,8 @@ def get_region():
     region : string
         default AWS region
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         if config.has_section("aws") and config.has_option("aws", "region"):
             return config.get("aws", "region")
@@ -525,30 +626,21 @@ def get_region():
                 region = os.environ["AWS_DEFAULT_REGION"]
             except KeyError:
                 # Get the default region from the AWS config file
-                home = os.path.expanduser("~")
-                aws_config_file = os.path.join(home, ".aws", "config")
-
-                fallback_region = "us-east-1"
-                if os.path.isfile(aws_config_file):
-                    aws_config = configparser.ConfigParser()
-                    aws_config.read(aws_config_file)
-                    try:
-                        region = aws_config.get(
-                            "default", "region", fallback=fallback_region
-                        )
-                    except TypeError:  # pragma: nocover
-                        # python 2.7 compatibility
-                        region = aws_config.get("default", "region")
-                        region = region if region else fallback_region
-                else:
-                    region = fallback_region
+                aws_config_file = os.path.join(
+                    os.path.expanduser("~"), ".aws", "config"
+                )
+
+                # _read_ini yields an empty parser for a missing file, so
+                # there is no need to check that the file exists first
+                region = _read_ini(aws_config_file).get(
+                    "default", "region", fallback="us-east-1"
+                )
 
             if not config.has_section("aws"):
                 config.add_section("aws")
 
             config.set("aws", "region", region)
-            with open(config_file, "w") as f:
-                config.write(f)
+            write_config(config)
 
             return region
 
@@ -564,6 +656,11 @@ def set_region(region="us-east-1"):
         An AWS region.
         Default: 'us-east-1'
     """
+    if read_config().get("aws", "region", fallback=None) == region:
+        # Nothing to validate, write, or invalidate
+        mod_logger.debug("Region is already %s", region)
+        return
+
     response = clients["ec2"].describe_regions()
     region_names = [d["RegionName"] for d in response.get("Regions")]
 
@@ -572,42 +669,66 @@ def set_region(region="us-east-1"):
             "`region` must be in {regions!s}".format(regions=region_names)
         )
 
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         if not config.has_section("aws"):  # pragma: nocover
             config.add_section("aws")
 
         config.set("aws", "region", region)
-        with open(config_file, "w") as f:
-            config.write(f)
-
-        # Update the boto3 clients so that the region change is reflected
-        # throughout the package
-        max_pool = clients["iam"].meta.config.max_pool_connections
-        boto_config = botocore.config.Config(max_pool_connections=max_pool)
-        profile_name = get_profile(fallback=None)
-        session = boto3.Session(
-            profile_name=profile_name if profile_name != "from-env" else None
-        )
-        clients["batch"] = session.client(
-            "batch", region_name=region, config=boto_config
-        )
-        clients["cloudformation"] = session.client(
-            "cloudformation", region_name=region, config=boto_config
-        )
-        clients["ecr"] = session.client("ecr", region_name=region, config=boto_config)
-        clients["ecs"] = session.client("ecs", region_name=region, config=boto_config)
-        clients["ec2"] = session.client("ec2", region_name=region, config=boto_config)
-        clients["iam"] = session.client("iam", region_name=region, config=boto_config)
-        clients["s3"] = session.client("s3", region_name=region, config=boto_config)
+        write_config(config)
+
+        # Discard the boto3 clients for the old region so that the region
+        # change is reflected throughout the package
+        _refresh_clients(max_pool=clients._max_pool)
 
     mod_logger.debug("Set region to {region:s}".format(region=region))
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_ini(path, stamp):
+    """Parse an INI file, memoized on its path and (mtime, size) stamp"""
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    return parser
+
+
+def _read_ini(path):
+    """Return the parsed contents of an AWS config or credentials file
+
+    The file is only re-parsed when its modification time or size changes.
+    The returned ConfigParser is shared between callers and must not be
+    modified.
+
+    Parameters
+    ----------
+    path : string
+        Path to the INI file. A missing file yields an empty ConfigParser.
+
+    Returns
+    -------
+    parser : configparser.ConfigParser
+        The parsed file
+    """
+    try:
+        file_stat = os.stat(path)
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+    except OSError:
+        stamp = None
+
+    return _parse_ini(path, stamp)
+
+
+#: return type of list_profiles
+ProfileInfo = namedtuple(
+    "ProfileInfo", ["profile_names", "credentials_file", "aws_config_file"]
+)
+
+
+#: matches "profile <name>" section headers in the aws config file
+_PROFILE_SECTION_RE = re.compile(r"^\s*profile\s+(\S+)\s*$")
+
+
 def list_profiles():
     """Return a list of available AWS profile names
 
@@ -639,25 +760,15 @@ def list_profiles():
         # Fallback on default aws config file path
         aws_config_file = os.path.join(aws, "config")
 
-    credentials = configparser.ConfigParser()
-    credentials.read(credentials_file)
-
-    aws_config = configparser.ConfigParser()
-    aws_config.read(aws_config_file)
+    credentials = _read_ini(credentials_file)
+    aws_config = _read_ini(aws_config_file)
 
     profile_names = [
-        s.split()[1]
-        for s in aws_config.sections()
-        if s.split()[0] == "profile" and len(s.split()) == 2
+        m.group(1) for m in map(_PROFILE_SECTION_RE.match, aws_config.sections()) if m
     ]
 
     profile_names += credentials.sections()
 
-    # define a namedtuple for return value type
-    ProfileInfo = namedtuple(
-        "ProfileInfo", ["profile_names", "credentials_file", "aws_config_file"]
-    )
-
     return ProfileInfo(
         profile_names=profile_names,
         credentials_file=credentials_file,
@@ -665,7 +776,9 @@ def list_profiles():
     )
 
 
-def get_user():
+@functools.lru_cache(maxsize=8)
+def _get_user(profile):
+    """Return the IAM user name for `profile`, memoized per profile"""
     user_info = clients["iam"].get_user().get("User")
     username = user_info.get("UserName")
     if username is None:
@@ -674,6 +787,12 @@ def get_user():
     return username
 
 
+def get_user():
+    # The IAM user does not change for a given profile, so avoid an IAM
+    # round trip every time that we tag a resource
+    return _get_user(get_profile())
+
+
 def get_profile(fallback="from-env"):
     """Get the AWS profile to use
 
@@ -694,11 +813,8 @@ def get_profile(fallback="from-env"):
         An AWS profile listed in the aws config file or aws shared
         credentials file
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         if config.has_section("aws") and config.has_option("aws", "profile"):
             return config.get("aws", "profile")
@@ -717,8 +833,7 @@ def get_profile(fallback="from-env"):
                 config.add_section("aws")
 
             config.set("aws", "profile", profile)
-            with open(config_file, "w") as f:
-                config.write(f)
+            write_config(config)
 
             return profile
 
@@ -734,6 +849,11 @@ def set_profile(profile_name):
         An AWS profile listed in the aws config file or aws shared
         credentials file
     """
+    if read_config().get("aws", "profile", fallback=None) == profile_name:
+        # Keep the cached sessions and clients for the unchanged profile
+        mod_logger.debug("Profile is already %s", profile_name)
+        return
+
     profile_info = list_profiles()
 
     if not (profile_name in profile_info.profile_names or profile_name == "from-env"):
@@ -745,79 +865,246 @@ def set_profile(profile_name):
             )
         )
 
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         if not config.has_section("aws"):  # pragma: nocover
             config.add_section("aws")
 
         config.set("aws", "profile", profile_name)
-        with open(config_file, "w") as f:
-            config.write(f)
-
-        # Update the boto3 clients so that the profile change is reflected
-        # throughout the package
-        max_pool = clients["iam"].meta.config.max_pool_connections
-        boto_config = botocore.config.Config(max_pool_connections=max_pool)
-        session = boto3.Session(
-            profile_name=profile_name if profile_name != "from-env" else None
-        )
-        clients["batch"] = session.client(
-            "batch", region_name=get_region(), config=boto_config
-        )
-        clients["cloudformation"] = session.client(
-            "cloudformation", region_name=get_region(), config=boto_config
-        )
-        clients["ecr"] = session.client(
-            "ecr", region_name=get_region(), config=boto_config
-        )
-        clients["ecs"] = session.client(
-            "ecs", region_name=get_region(), config=boto_config
-        )
-        clients["ec2"] = session.client(
-            "ec2", region_name=get_region(), config=boto_config
-        )
-        clients["iam"] = session.client(
-            "iam", region_name=get_region(), config=boto_config
-        )
-        clients["s3"] = session.client(
-            "s3", region_name=get_region(), config=boto_config
-        )
+        write_config(config)
+
+        # Drop cached sessions so that credentials are re-resolved, then
+        # discard the boto3 clients for the old profile so that the profile
+        # change is reflected throughout the package
+        _get_session.cache_clear()
+        _get_user.cache_clear()
+        _refresh_clients(max_pool=clients._max_pool)
 
     mod_logger.debug("Set profile to {profile:s}".format(profile=profile_name))
 
 
+#: default size of each client's connection pool. Override with the
+#: CLOUDKNOT_MAX_POOL_CONNECTIONS environment variable. Idle connections
+#: cost a few kB each, while a pool smaller than the number of concurrent
+#: requests (e.g. parallel S3 transfers or job submissions) makes the extra
+#: requests queue for a free connection.
+_DEFAULT_MAX_POOL = int(os.environ.get("CLOUDKNOT_MAX_POOL_CONNECTIONS", "50"))
+
+#: botocore config shared by all clients. TCP keepalive lets pooled
+#: connections survive between calls and adaptive retries back off when
+#: AWS throttles us.
+_DEFAULT_CONFIG = botocore.config.Config(
+    max_pool_connections=_DEFAULT_MAX_POOL,
+    tcp_keepalive=True,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_session(profile):
+    """Return a boto3 session for `profile`, reusing it across clients
+
+    Creating a session resolves credential providers and loads the botocore
+    data loader, so we build it once per profile rather than once per client.
+
+    Parameters
+    ----------
+    profile : string or None
+        The AWS profile name. None or 'from-env' use the default
+        credential chain.
+
+    Returns
+    -------
+    session : boto3.Session
+        A boto3 session for the requested profile
+    """
+    # boto3 is imported on first use. It pulls in s3transfer and the
+    # resource factory, which "import cloudknot" does not otherwise need.
+    import boto3
+
+    session = boto3.Session(profile_name=profile if profile != "from-env" else None)
+
+    # Share the AWS CLI's on-disk cache of assumed-role credentials so that
+    # warm runs reuse a still-valid token instead of calling STS again. This
+    # reaches into botocore internals, so if they change we simply go
+    # without the cache.
+    try:
+        resolver = session._session.get_component("credential_provider")
+        assume_role = resolver.get_provider("assume-role")
+    except (AttributeError, ValueError, botocore.exceptions.BotoCoreError):
+        assume_role = None
+
+    if assume_role is not None:
+        cache_dir = os.path.join(os.path.expanduser("~"), ".aws", "cli", "cache")
+        assume_role.cache = botocore.credentials.JSONFileCache(cache_dir)
+
+    return session
+
+
+def _make_client(name, profile, region, max_pool):
+    """Create a boto3 client
+
+    Parameters
+    ----------
+    name : string
+        The AWS service name, e.g. 'batch' or 'iam'
+
+    profile : string or None
+        The AWS profile name. None or 'from-env' use the default
+        credential chain.
+
+    region : string
+        The AWS region name
+
+    max_pool : int
+        The maximum number of connections in the client's connection pool
+
+    Returns
+    -------
+    client : botocore.client.BaseClient
+        A boto3 client for service `name`
+    """
+    config = _DEFAULT_CONFIG
+    if max_pool != _DEFAULT_MAX_POOL:
+        config = config.merge(botocore.config.Config(max_pool_connections=max_pool))
+
+    return _get_session(profile).client(name, region_name=region, config=config)
+
+
+class _LazyClients(dict):
+    """Dictionary of boto3 clients that creates each client on first access
+
+    Building a boto3 client loads the service model and resolves credentials,
+    so we defer that work until a client is actually requested. Once created,
+    a client is stored in the dictionary and subsequent lookups are ordinary
+    dictionary lookups.
+
+    Apart from the laziness, this behaves like a dictionary that holds every
+    client: membership tests, `get`, `len`, iteration and the keys, values
+    and items views all cover every service, building clients as needed.
+
+    Each client remembers the (profile, region, max_pool) key that it was
+    built with so that a refresh only discards the clients that are stale.
+    """
+
+    _client_names = ("batch", "cloudformation", "ecr", "ecs", "ec2", "iam", "s3")
+
+    def __init__(self):
+        super(_LazyClients, self).__init__()
+        self._max_pool = _DEFAULT_MAX_POOL
+        self._keys = {}
+        # Bumped whenever a client is discarded so that a client built
+        # concurrently with an invalidation is never stored
+        self._generation = 0
+        # Serializes client construction, since boto3 sessions are not
+        # thread-safe. It is never held while waiting on rlock, so callers
+        # that already hold rlock cannot deadlock against a builder.
+        self._build_lock = threading.Lock()
+
+    def _current_key(self):
+        return get_profile(fallback=None), get_region(), self._max_pool
+
+    def __contains__(self, key):
+        return key in self._client_names
+
+    def __iter__(self):
+        return iter(self._client_names)
+
+    def __len__(self):
+        return len(self._client_names)
+
+    def get(self, key, default=None):
+        return self[key] if key in self._client_names else default
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def __missing__(self, key):
+        if key not in self._client_names:
+            raise KeyError(key)
+
+        while True:
+            with rlock:
+                if dict.__contains__(self, key):
+                    return dict.__getitem__(self, key)
+
+                generation = self._generation
+                client_key = self._current_key()
+
+            # Build outside of rlock so that config file access and lookups
+            # of existing clients are not blocked by the (slow) construction
+            with self._build_lock:
+                # Another thread may have built this client while we waited
+                if dict.__contains__(self, key):
+                    continue
+
+                client = _make_client(key, *client_key)
+
+            with rlock:
+                if dict.__contains__(self, key):
+                    return dict.__getitem__(self, key)
+
+                # Only store the client if nothing was invalidated meanwhile
+                if generation == self._generation:
+                    self[key] = client
+                    self._keys[key] = client_key
+                    return client
+
+    def invalidate(self, name):
+        """Discard a single client so that it is rebuilt on next access
+
+        Parameters
+        ----------
+        name : string
+            The AWS service name, e.g. 'batch' or 'iam'
+        """
+        with rlock:
+            self.pop(name, None)
+            self._keys.pop(name, None)
+            self._generation += 1
+
+    def _invalidate_stale(self, all_clients=False):
+        """Discard clients built for a different profile, region or pool size
+
+        Parameters
+        ----------
+        all_clients : bool
+            If True, discard every client, e.g. to pick up new credentials.
+            Default: False
+
+        Returns
+        -------
+        list
+            The names of the discarded clients
+        """
+        with rlock:
+            self._generation += 1
+            client_key = self._current_key()
+            stale = [
+                name
+                for name in list(dict.keys(self))
+                if all_clients or self._keys.get(name) != client_key
+            ]
+            for name in stale:
+                self.invalidate(name)
+
+        return stale
+
+
 #: module-level dictionary of boto3 clients for IAM, EC2, Batch, ECR, ECS, S3.
-clients = {
-    "batch": boto3.Session(profile_name=get_profile(fallback=None)).client(
-        "batch", region_name=get_region()
-    ),
-    "cloudformation": boto3.Session(profile_name=get_profile(fallback=None)).client(
-        "cloudformation", region_name=get_region()
-    ),
-    "ecr": boto3.Session(profile_name=get_profile(fallback=None)).client(
-        "ecr", region_name=get_region()
-    ),
-    "ecs": boto3.Session(profile_name=get_profile(fallback=None)).client(
-        "ecs", region_name=get_region()
-    ),
-    "ec2": boto3.Session(profile_name=get_profile(fallback=None)).client(
-        "ec2", region_name=get_region()
-    ),
-    "iam": boto3.Session(profile_name=get_profile(fallback=None)).client(
-        "iam", region_name=get_region()
-    ),
-    "s3": boto3.Session(profile_name=get_profile(fallback=None)).client(
-        "s3", region_name=get_region()
-    ),
-}
+clients = _LazyClients()
 """module-level dictionary of boto3 clients.
 
 Storing the boto3 clients in a module-level dictionary allows us to change
-the region and profile and have those changes reflected globally.
+the region and profile and have those changes reflected globally. Clients
+are created lazily, the first time that they are requested.
 
 Advanced users: if you want to use cloudknot and boto3 at the same time,
 you should use these clients to ensure that you have the right profile
@@ -825,22 +1112,101 @@ and region.
 """
 
 
-def refresh_clients(max_pool=10):
-    """Refresh the boto3 clients dictionary"""
+def refresh_clients(max_pool=None):
+    """Refresh the boto3 clients dictionary
+
+    The cached boto3 sessions and IAM user lookups are discarded, along with
+    every client, so that the clients are rebuilt with fresh credentials the
+    next time that they are requested. Use this after rotating keys, changing
+    the AWS_* environment variables, or renewing SSO or assumed-role
+    credentials. Cached IAM policy, S3 bucket, ECR repository and Batch job
+    definition lookups are also discarded.
+
+    If the CLOUDKNOT_WARM_CLIENTS environment variable is set, the discarded
+    clients are instead rebuilt right away in a background thread, so that
+    the refresh does not stall the next AWS call.
+
+    Parameters
+    ----------
+    max_pool : int, optional
+        The maximum number of connections in each client's connection pool.
+        Default: the CLOUDKNOT_MAX_POOL_CONNECTIONS environment variable if
+        set, otherwise 50
+    """
+    _refresh_clients(max_pool=max_pool, stale_only=False)
+
+
+def _refresh_clients(max_pool=None, stale_only=True):
+    """Refresh the boto3 clients dictionary, optionally keeping current clients
+
+    Parameters
+    ----------
+    max_pool : int, optional
+        The maximum number of connections in each client's connection pool.
+        Default: the CLOUDKNOT_MAX_POOL_CONNECTIONS environment variable if
+        set, otherwise 50
+
+    stale_only : bool
+        If True, keep the cached sessions and every client that was built
+        for the current profile, region, and pool size. set_region,
+        set_profile, and Knot.map use this, since they only change which
+        clients are needed, not the credentials. Default: True
+    """
+    if max_pool is None:
+        max_pool = _DEFAULT_MAX_POOL
+
+    # Imported here because batch and ecr import this module
+    from .batch import _clear_job_def_cache
+    from .ecr import _clear_repo_cache
+
     with rlock:
-        config = botocore.config.Config(max_pool_connections=max_pool)
-        session = boto3.Session(profile_name=get_profile(fallback=None))
-        clients["iam"] = session.client("iam", region_name=get_region(), config=config)
-        clients["ec2"] = session.client("ec2", region_name=get_region(), config=config)
-        clients["batch"] = session.client(
-            "batch", region_name=get_region(), config=config
-        )
-        clients["ecr"] = session.client("ecr", region_name=get_region(), config=config)
-        clients["ecs"] = session.client("ecs", region_name=get_region(), config=config)
-        clients["s3"] = session.client("s3", region_name=get_region(), config=config)
-        clients["cloudformation"] = session.client(
-            "cloudformation", region_name=get_region(), config=config
-        )
+        clients._max_pool = max_pool
+        if not stale_only:
+            # New credentials may belong to another account, so forget what
+            # the old ones saw of its IAM policies and S3 buckets
+            _get_session.cache_clear()
+            _get_user.cache_clear()
+            _policy_cache.clear()
+            _verified_s3_params.clear()
+
+        stale = clients._invalidate_stale(all_clients=not stale_only)
+        _clear_repo_cache()
+        _clear_job_def_cache()
+
+    if stale and os.environ.get("CLOUDKNOT_WARM_CLIENTS"):
+        _warm_clients(stale)
+
+
+def _warm_clients(names=()):
+    """Open the first IAM connection in a background thread
+
+    The first request on a new client pays for the TLS handshake and for
+    loading the request signer. Looking up the IAM user pays that cost off
+    the critical path and also fills the get_user() cache, which every
+    resource creation needs for its tags.
+
+    Parameters
+    ----------
+    names : sequence of strings, optional
+        Other clients to build first, e.g. the clients discarded by
+        refresh_clients(). They are built one after another because they
+        share a single (non thread-safe) boto3 session.
+    """
+
+    def warm():
+        try:
+            for name in names:
+                clients[name]
+            get_user()
+        except Exception:  # pragma: nocover
+            # Warming is best effort. Real errors surface on first real use
+            mod_logger.debug("Could not warm the AWS clients", exc_info=True)
+
+    threading.Thread(target=warm, name="cloudknot-warm-clients", daemon=True).start()
+
+
+if os.environ.get("CLOUDKNOT_WARM_CLIENTS"):
+    _warm_clients()
 
 
 # noinspection PyPropertyAccess,PyAttributeOutsideInit
@@ -1049,6 +1415,10 @@ class CloudknotInputError(Exception):
         super(CloudknotInputError, self).__init__(msg)
 
 
+#: pattern that the names of cloudknot resources must match
+_NAME_PATTERN = re.compile("^[a-zA-Z][-a-zA-Z0-9]*$")
+
+
 # noinspection PyPropertyAccess,PyAttributeOutsideInit
 class NamedObject(object):
     """Base class for building objects with name property"""
@@ -1062,20 +1432,12 @@ class NamedObject(object):
             Name of the object.
             Must satisfy regular expression pattern: [a-zA-Z][-a-zA-Z0-9]*
         """
-        config_file = get_config_file()
-        conf = configparser.ConfigParser()
+        # read_config only re-parses the config file when it has changed
         with rlock:
-            conf.read(config_file)
-
-            if not (
-                conf.has_section("aws")
-                and conf.has_option("aws", "configured")
-                and conf.get("aws", "configured") == "True"
-            ):
-                raise CloudknotConfigurationError(config_file)
+            if read_config().get("aws", "configured", fallback=None) != "True":
+                raise CloudknotConfigurationError(get_config_file())
 
-        pattern = re.compile("^[a-zA-Z][-a-zA-Z0-9]*$")
-        if not pattern.match(name):
+        if not _NAME_PATTERN.match(name):
             raise CloudknotInputError(
                 "We use name in AWS resource identifiers so it must "
                 "satisfy the regular expression pattern: [a-zA-Z][-a-zA-Z0-9]*"
@@ -1,14 +1,11 @@
 import cloudknot.config
-import cloudpickle
-from datetime import datetime
 import logging
 import pickle
+import threading
 import time
 
-try:
-    from collections.abc import namedtuple
-except ImportError:
-    from collections import namedtuple
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from ..dockerimage import DEFAULT_PICKLE_PROTOCOL
 from .base_classes import (
@@ -25,6 +22,153 @@ from .base_classes import (
 __all__ = ["BatchJob"]
 mod_logger = logging.getLogger(__name__)
 
+#: job definition info, as stored in BatchJob.job_definition
+JobDef = namedtuple("JobDef", ["name", "arn", "output_bucket", "retries"])
+
+#: cached JobDef lookups, keyed on job definition ARN. The ARN includes the
+#: revision number and a revision cannot be changed, so entries never go stale.
+_job_def_cache = {}
+
+
+def _clear_job_def_cache():
+    """Forget all cached job definition lookups"""
+    _job_def_cache.clear()
+
+
+def _get_job_def(job_def_arn):
+    """Return the JobDef for a job definition ARN
+
+    Parameters
+    ----------
+    job_def_arn : string
+        ARN of the job definition, including its revision number
+
+    Returns
+    -------
+    JobDef
+        namedtuple with fields ['name', 'arn', 'output_bucket', 'retries']
+    """
+    job_definition = _job_def_cache.get(job_def_arn)
+    if job_definition is not None:
+        return job_definition
+
+    response = clients["batch"].describe_job_definitions(jobDefinitions=[job_def_arn])
+    job_def = response.get("jobDefinitions")[0]
+    job_def_env = job_def["containerProperties"]["environment"]
+    bucket_env = [e for e in job_def_env if e["name"] == "CLOUDKNOT_JOBS_S3_BUCKET"]
+
+    job_definition = JobDef(
+        name=job_def["jobDefinitionName"],
+        arn=job_def_arn,
+        output_bucket=bucket_env[0]["value"] if bucket_env else None,
+        retries=job_def["retryStrategy"]["attempts"],
+    )
+
+    _job_def_cache[job_def_arn] = job_definition
+    return job_definition
+
+
+#: seconds for which BatchJob.status reuses its last describe_jobs response
+_STATUS_TTL = 2
+
+#: factor by which BatchJob.result() lengthens the wait between polls
+_POLL_BACKOFF = 1.5
+
+#: longest wait, in seconds, between polls in BatchJob.result()
+_POLL_MAX_DELAY = 60
+
+#: maximum number of threads that download array job results
+_RESULT_WORKERS = 32
+
+#: maximum number of job IDs accepted by one describe_jobs call
+_DESCRIBE_JOBS_MAX = 100
+
+
+class _PollRound(object):
+    """The job IDs to describe in one round of _StatusPoller and the results"""
+
+    def __init__(self):
+        self.job_ids = set()
+        self.jobs = {}
+        self.error = None
+        self.done = threading.Event()
+
+
+class _StatusPoller(object):
+    """Coalesce the describe_jobs calls of threads waiting on batch jobs
+
+    Every `interval` seconds, a background thread describes all of the jobs
+    that threads are waiting on, at most _DESCRIBE_JOBS_MAX at a time, and
+    wakes the waiters up. Waiting on many jobs at once, e.g. the futures
+    returned by Knot.map(), then makes one AWS request per hundred jobs
+    rather than one per job. The thread exits when nobody is waiting.
+    """
+
+    def __init__(self, interval=1):
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._round = None
+        self._thread = None
+
+    def poll(self, job_id):
+        """Wait for the next poll round and return the job's description
+
+        Parameters
+        ----------
+        job_id : string
+            The AWS Batch job ID
+
+        Returns
+        -------
+        dict or None
+            The job's entry in the describe_jobs response, or None if AWS
+            Batch did not return the job
+        """
+        with self._lock:
+            if self._round is None:
+                self._round = _PollRound()
+            this_round = self._round
+            this_round.job_ids.add(job_id)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="cloudknot-status-poller", daemon=True
+                )
+                self._thread.start()
+
+        this_round.done.wait()
+        if this_round.error is not None:
+            raise this_round.error
+
+        return this_round.jobs.get(job_id)
+
+    def _run(self):
+        while True:
+            time.sleep(self._interval)
+
+            with self._lock:
+                this_round, self._round = self._round, None
+                if this_round is None:
+                    # Nobody is waiting, so let the thread exit
+                    self._thread = None
+                    return
+
+            job_ids = sorted(this_round.job_ids)
+            try:
+                for i in range(0, len(job_ids), _DESCRIBE_JOBS_MAX):
+                    response = clients["batch"].describe_jobs(
+                        jobs=job_ids[i : i + _DESCRIBE_JOBS_MAX]
+                    )
+                    this_round.jobs.update((j["jobId"], j) for j in response["jobs"])
+            except Exception as e:
+                this_round.error = e
+            finally:
+                this_round.done.set()
+
+
+#: module-level poller shared by all BatchJob.result() calls
+_status_poller = _StatusPoller()
+
 
 def _exists_already(job_id):
     """
@@ -68,23 +212,7 @@ def _exists_already(job_id):
 
         array_job = "arrayProperties" in job
 
-        response = clients["batch"].describe_job_definitions(
-            jobDefinitions=[job_def_arn]
-        )
-        job_def = response.get("jobDefinitions")[0]
-        job_def_name = job_def["jobDefinitionName"]
-        job_def_env = job_def["containerProperties"]["environment"]
-        bucket_env = [e for e in job_def_env if e["name"] == "CLOUDKNOT_JOBS_S3_BUCKET"]
-        output_bucket = bucket_env[0]["value"] if bucket_env else None
-        job_def_retries = job_def["retryStrategy"]["attempts"]
-
-        JobDef = namedtuple("JobDef", ["name", "arn", "output_bucket", "retries"])
-        job_definition = JobDef(
-            name=job_def_name,
-            arn=job_def_arn,
-            output_bucket=output_bucket,
-            retries=job_def_retries,
-        )
+        job_definition = _get_job_def(job_def_arn)
 
         mod_logger.info("Job {id:s} exists.".format(id=job_id))
 
@@ -169,6 +297,8 @@ class BatchJob(NamedObject):
             )
 
         self._starmap = starmap
+        # (monotonic time, status dict) of the last status query
+        self._status_cache = None
 
         if job_id:
             job = _exists_already(job_id=job_id)
@@ -302,6 +432,11 @@ class BatchJob(NamedObject):
         # unit testing would be expensive
         bucket = self.job_definition.output_bucket
         sse = get_s3_params().sse
+
+        # Imported here so that BatchJob objects that only query an existing
+        # job do not pay for importing cloudpickle
+        import cloudpickle
+
         pickled_input = cloudpickle.dumps(self.input, protocol=DEFAULT_PICKLE_PROTOCOL)
 
         command = [self.job_definition.output_bucket]
@@ -369,6 +504,9 @@ class BatchJob(NamedObject):
         """
         Query AWS batch job status using instance parameter `self.job_id`.
 
+        The response is reused for two seconds, so that e.g. checking `done`
+        and then reading `status` makes only one AWS request.
+
         Returns
         -------
         status : dict
@@ -382,11 +520,21 @@ class BatchJob(NamedObject):
 
         self.check_profile_and_region()
 
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < _STATUS_TTL:
+            return cached[1]
+
         # Query the job_id
         response = clients["batch"].describe_jobs(jobs=[self.job_id])
-        job = response.get("jobs")[0]
+        return self._cache_status(self._status_from_job(response.get("jobs")[0]))
+
+    def _cache_status(self, status):
+        """Remember `status` for _STATUS_TTL seconds and return it"""
+        self._status_cache = (time.monotonic(), status)
+        return status
 
-        # Return only a subset of the job dictionary
+    def _status_from_job(self, job):
+        """Return the subset of a describe_jobs entry that `status` reports"""
         keys = ["status", "statusReason", "attempts"]
 
         if self.array_job:
@@ -396,6 +544,23 @@ class BatchJob(NamedObject):
 
         return status
 
+    def _poll_status(self):
+        """Return the job status from the next round of the shared poller"""
+        if self.clobbered:
+            raise ResourceClobberedException(
+                "This batch job has already been clobbered.", self.job_id
+            )
+
+        self.check_profile_and_region()
+
+        job = _status_poller.poll(self.job_id)
+        if job is None:
+            raise ResourceDoesNotExistException(
+                "AWS Batch did not return job {0:s}".format(self.job_id), self.job_id
+            )
+
+        return self._cache_status(self._status_from_job(job))
+
     @property
     def log_urls(self):
         """
@@ -429,7 +594,10 @@ class BatchJob(NamedObject):
         In this case, "done" means the job status is SUCCEEDED or that it is
         FAILED and the job has exceeded the max number of retry attempts
         """
-        stat = self.status
+        return self._is_done(self.status)
+
+    def _is_done(self, stat):
+        """Return True if the job with status dict `stat` is done"""
         done = stat["status"] == "SUCCEEDED" or (
             stat["status"] == "FAILED"
             and len(stat["attempts"]) >= self.job_definition.retries
@@ -506,26 +674,47 @@ class BatchJob(NamedObject):
             The result of the AWS Batch job
         """
         # Set start time for timeout period
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         def time_diff():
-            return (datetime.now() - start_time).seconds
+            return time.monotonic() - start_time
 
-        while not self.done and (timeout is None or time_diff() < timeout):
-            time.sleep(5)
+        # Poll through the shared poller, which describes all of the jobs
+        # that are being waited on with as few requests as possible. Back off
+        # between polls while the job's state is unchanged, so that long
+        # running jobs are not polled every second.
+        status = self.status
+        delay = 0.0
+        while not self._is_done(status) and (timeout is None or time_diff() < timeout):
+            if delay:
+                if timeout is not None:
+                    delay = min(delay, max(timeout - time_diff(), 0))
+                time.sleep(delay)
+
+            previous = status["status"]
+            status = self._poll_status()
+
+            if status["status"] != previous:
+                delay = 0.0
+            else:
+                delay = min(max(delay * _POLL_BACKOFF, 1.0), _POLL_MAX_DELAY)
 
-        if not self.done:
+        if not self._is_done(status):
             raise CKTimeoutError(self.job_id)
 
-        status = self.status
         if status["status"] == "FAILED":
             raise BatchJobFailedError(self.job_id)
         else:
             if self.array_job:
-                return [
-                    self._collect_array_job_result(idx)
-                    for idx in range(len(self.input))
-                ]
+                # Fetch the array elements concurrently. Knot.map may have
+                # shrunk the clients' connection pool, so never run more
+                # workers than the pool has connections.
+                n_elements = len(self.input)
+                n_workers = min(_RESULT_WORKERS, clients._max_pool, n_elements)
+                with ThreadPoolExecutor(max(n_workers, 1)) as e:
+                    return list(
+                        e.map(self._collect_array_job_result, range(n_elements))
+                    )
             else:
                 return self._collect_array_job_result()
 
@@ -556,6 +745,8 @@ class BatchJob(NamedObject):
         if not isinstance(reason, str):
             raise CloudknotInputError("reason must be a string.")
 
+        # Choosing between cancel and terminate needs the current state
+        self._status_cache = None
         state = self.status["status"]
 
         if state in ["SUBMITTED", "PENDING", "RUNNABLE"]:
@@ -573,6 +764,9 @@ class BatchJob(NamedObject):
                 )
             )
 
+        # The job's state has changed, so forget the cached status
+        self._status_cache = None
+
     def clobber(self):
         """Kill an batch job and remove it's info from config."""
         if self.clobbered:
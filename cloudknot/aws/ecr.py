@@ -1,17 +1,30 @@
 import botocore
 import cloudknot.config
 import logging
+import time
 
-try:
-    from collections.abc import namedtuple
-except ImportError:
-    from collections import namedtuple
+from collections import namedtuple
 
 from .base_classes import NamedObject, clients, get_ecr_repo, get_tags
 
 __all__ = ["DockerRepo"]
 mod_logger = logging.getLogger(__name__)
 
+RepoInfo = namedtuple("RepoInfo", ["name", "uri", "registry_id"])
+
+#: seconds for which a repo lookup is reused. A repo deleted by another
+#: process is then only reported as existing for a short while.
+_REPO_CACHE_TTL = 60
+
+#: (monotonic time, RepoInfo) for repos that this process has already
+#: created or looked up, keyed on (profile, region, name, tags)
+_repo_info_cache = {}
+
+
+def _clear_repo_cache():
+    """Forget all cached ECR repository lookups"""
+    _repo_info_cache.clear()
+
 
 def _get_repo_info_from_uri(repo_uri):
     # Get all repositories
@@ -95,6 +108,22 @@ class DockerRepo(NamedObject):
         RepoInfo : namedtuple
             a namedtuple with fields name, uri, and registry_id
         """
+        # Knots that share a repo would otherwise each describe and re-tag
+        # the same repository
+        cache_key = (
+            self.profile,
+            self.region,
+            self.name,
+            frozenset((tag["Key"], tag["Value"]) for tag in self.tags),
+        )
+        cached = _repo_info_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _REPO_CACHE_TTL:
+            repo_info = cached[1]
+            mod_logger.info(
+                "Repository %s already exists at %s", self.name, repo_info.uri
+            )
+            return repo_info
+
         # Flake8 will see that repo_arn is set in the try/except clauses
         # and claim that we are referencing it before assignment below
         # so we predefine it here. Also, it should be predefined as a
@@ -159,8 +188,9 @@ class DockerRepo(NamedObject):
                 raise e
 
         # Define and return namedtuple with repo info
-        RepoInfo = namedtuple("RepoInfo", ["name", "uri", "registry_id"])
-        return RepoInfo(name=repo_name, uri=repo_uri, registry_id=repo_registry_id)
+        repo_info = RepoInfo(name=repo_name, uri=repo_uri, registry_id=repo_registry_id)
+        _repo_info_cache[cache_key] = (time.monotonic(), repo_info)
+        return repo_info
 
     def clobber(self):
         """Delete this remote repository."""
@@ -189,6 +219,11 @@ class DockerRepo(NamedObject):
                 ):
                     pass
 
+        # Drop cached lookups of the deleted repo
+        repo_id = (self.profile, self.region, self.name)
+        for key in [k for k in _repo_info_cache if k[:3] == repo_id]:
+            _repo_info_cache.pop(key, None)
+
         # Remove from the config file
         cloudknot.config.remove_resource(self._section_name, self.name)
 
@@ -1,6 +1,5 @@
 """Create Pars and Knot classes which represent AWS Cloudformation stack."""
 import botocore
-import configparser
 import ipaddress
 import logging
 import os
@@ -9,9 +8,11 @@ from collections.abc import Iterable
 from collections import namedtuple
 
 from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 from . import aws
-from .config import get_config_file, rlock, is_valid_stack
+from .config import get_config_file, read_config, write_config, rlock
+from .config import _describe_valid_stack
 from . import dockerimage
 
 __all__ = ["Pars", "Knot"]
@@ -25,6 +26,55 @@ def _stack_out(key, outputs):
     return o["OutputValue"]
 
 
+def _validated_int(value, name, default, minimum, maximum=None):
+    """Convert an integer input, falling back on a default if it is None.
+
+    Parameters
+    ----------
+    value : int, str, or None
+        The input value
+
+    name : str
+        The input parameter name, used in error messages
+
+    default : int
+        Value to use if `value` is None
+
+    minimum : int
+        Smallest allowed value
+
+    maximum : int, optional
+        Largest allowed value
+
+    Returns
+    -------
+    int
+        The validated integer
+    """
+    if value is None:
+        return default
+
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise aws.CloudknotInputError("{0:s} must be an integer".format(name))
+
+    if value < minimum:
+        if minimum == 0:
+            requirement = "non-negative"
+        elif minimum == 1:
+            requirement = "positive"
+        else:
+            requirement = ">= {0:d}".format(minimum)
+
+        raise aws.CloudknotInputError("{0:s} must be {1:s}".format(name, requirement))
+
+    if maximum is not None and value > maximum:
+        raise aws.CloudknotInputError("{0:s} must be <= {1:d}".format(name, maximum))
+
+    return value
+
+
 def _ec2_instance_types():
     """Yield all available EC2 instance types."""
     paginator = aws.clients["ec2"].get_paginator("describe_instance_types")
@@ -121,28 +171,35 @@ class Pars(aws.NamedObject):
         # Validate aws_resource_tags input before creating any resources
         self._tags = aws.get_tags(name=name, additional_tags=aws_resource_tags)
 
-        # Check for existence of this pars in the config file
-        config = configparser.ConfigParser()
+        # Check for existence of this pars in the config file. Take a
+        # snapshot of its section, since the shared config may be modified
+        # by other threads while this PARS is being set up.
+        self._pars_name = "pars " + self.name
         with rlock:
-            config.read(get_config_file())
+            config = read_config()
+            pars_conf = (
+                dict(config.items(self._pars_name))
+                if config.has_section(self._pars_name)
+                else None
+            )
 
-        self._pars_name = "pars " + self.name
-        if self._pars_name in config.sections():
-            self._region = config.get(self._pars_name, "region")
-            self._profile = config.get(self._pars_name, "profile")
+        if pars_conf is not None:
+            self._region = pars_conf["region"]
+            self._profile = pars_conf["profile"]
             self.check_profile_and_region()
 
-            mod_logger.info("Found PARS {name:s} in config".format(name=name))
+            mod_logger.info("Found PARS %s in config", name)
 
-            self._stack_id = config.get(self._pars_name, "stack-id")
+            self._stack_id = pars_conf["stack-id"]
 
-            if not is_valid_stack(self._stack_id):
+            # Reuse the stack description rather than describing it twice
+            stack = _describe_valid_stack(self._stack_id)
+            if stack is None:
                 # Remove this section from the config file
                 with rlock:
-                    config.read(get_config_file())
+                    config = read_config()
                     config.remove_section(self._pars_name)
-                    with open(get_config_file(), "w") as f:
-                        config.write(f)
+                    write_config(config)
                 raise aws.ResourceDoesNotExistException(
                     "Cloudknot found this PARS in its config file, but "
                     "the PARS stack that you requested does not exist on "
@@ -152,10 +209,7 @@ class Pars(aws.NamedObject):
                     self._stack_id,
                 )
 
-            response = aws.clients["cloudformation"].describe_stacks(
-                StackName=self._stack_id
-            )
-            outs = response.get("Stacks")[0]["Outputs"]
+            outs = stack["Outputs"]
 
             self._batch_service_role = _stack_out("BatchServiceRole", outs)
             self._ecs_instance_role = _stack_out("EcsInstanceRole", outs)
@@ -165,17 +219,35 @@ class Pars(aws.NamedObject):
             self._subnets = _stack_out("SubnetIds", outs).split(",")
             self._security_group = _stack_out("SecurityGroupId", outs)
 
-            vpc_response = aws.clients["ec2"].describe_vpcs(VpcIds=[self._vpc])["Vpcs"][
-                0
-            ]
-            stack_instance_tenancy = vpc_response["InstanceTenancy"]
-            stack_ipv4_cidr = vpc_response["CidrBlock"]
-            ecs_response = aws.clients["iam"].list_attached_role_policies(
-                RoleName=self._ecs_instance_role.split("/")[-1]
-            )
-            stack_policies = set(
-                [d["PolicyName"] for d in ecs_response["AttachedPolicies"]]
-            )
+            # The VPC and role policy lookups are only needed to check the
+            # user's input for conflicts, so skip them when there is nothing
+            # to check. They are independent, so issue them concurrently.
+            stack_instance_tenancy = None
+            stack_ipv4_cidr = None
+            stack_policies = set()
+            vpc_future = None
+            ecs_future = None
+            with ThreadPoolExecutor(2) as e:
+                if ipv4_cidr or instance_tenancy:
+                    vpc_future = e.submit(
+                        aws.clients["ec2"].describe_vpcs, VpcIds=[self._vpc]
+                    )
+                if policies:
+                    ecs_future = e.submit(
+                        aws.clients["iam"].list_attached_role_policies,
+                        RoleName=self._ecs_instance_role.split("/")[-1],
+                    )
+
+            if vpc_future is not None:
+                vpc_response = vpc_future.result()["Vpcs"][0]
+                stack_instance_tenancy = vpc_response["InstanceTenancy"]
+                stack_ipv4_cidr = vpc_response["CidrBlock"]
+
+            if ecs_future is not None:
+                ecs_response = ecs_future.result()
+                stack_policies = set(
+                    [d["PolicyName"] for d in ecs_response["AttachedPolicies"]]
+                )
 
             # Pars exists, check that user did not provide any conflicting
             # resource names. This dict has values that are tuples, the first
@@ -213,13 +285,13 @@ class Pars(aws.NamedObject):
                     "provided were {l}".format(l=list(conflicting_params.keys()))
                 )
 
-            conf_bsr = config.get(self._pars_name, "batch-service-role")
-            conf_sfr = config.get(self._pars_name, "spot-fleet-role")
-            conf_ecsr = config.get(self._pars_name, "ecs-instance-role")
-            conf_ecsp = config.get(self._pars_name, "ecs-instance-profile")
-            conf_vpc = config.get(self._pars_name, "vpc")
-            conf_subnets = config.get(self._pars_name, "subnets")
-            conf_sg = config.get(self._pars_name, "security-group")
+            conf_bsr = pars_conf["batch-service-role"]
+            conf_sfr = pars_conf["spot-fleet-role"]
+            conf_ecsr = pars_conf["ecs-instance-role"]
+            conf_ecsp = pars_conf["ecs-instance-profile"]
+            conf_vpc = pars_conf["vpc"]
+            conf_subnets = pars_conf["subnets"]
+            conf_sg = pars_conf["security-group"]
 
             if not all(
                 [
@@ -296,16 +368,13 @@ class Pars(aws.NamedObject):
                 paginator = aws.clients["iam"].get_paginator("list_policies")
                 response_iterator = paginator.paginate()
 
-                # response_iterator is a list of dicts. First convert to list of lists
-                # and the flatten to a single list
-                response_policies = [
-                    response["Policies"] for response in response_iterator
-                ]
-                policies_list = [
-                    lst for sublist in response_policies for lst in sublist
-                ]
-
-                aws_policies = {d["PolicyName"]: d["Arn"] for d in policies_list}
+                # Chain the pages together rather than building a list of lists
+                aws_policies = {
+                    d["PolicyName"]: d["Arn"]
+                    for d in chain.from_iterable(
+                        r["Policies"] for r in response_iterator
+                    )
+                }
 
                 # If input policies are not subset of aws_policies, throw error
                 if not (set(policy_names) < set(aws_policies.keys())):
@@ -583,7 +652,7 @@ class Pars(aws.NamedObject):
             # Save the new pars resources in config object
             # Use config.set() for python 2.7 compatibility
             with rlock:
-                config.read(get_config_file())
+                config = read_config()
                 config.add_section(self._pars_name)
                 config.set(self._pars_name, "stack-id", self._stack_id)
                 config.set(self._pars_name, "region", self.region)
@@ -603,8 +672,7 @@ class Pars(aws.NamedObject):
                 config.set(self._pars_name, "security-group", self._security_group)
 
                 # Save config to file
-                with open(get_config_file(), "w") as f:
-                    config.write(f)
+                write_config(config)
 
     @property
     def pars_name(self):
@@ -666,19 +734,16 @@ class Pars(aws.NamedObject):
         aws.clients["cloudformation"].delete_stack(StackName=self._stack_id)
 
         # Remove this section from the config file
-        config = configparser.ConfigParser()
-
         with rlock:
-            config.read(get_config_file())
+            config = read_config()
             config.remove_section(self._pars_name)
-            with open(get_config_file(), "w") as f:
-                config.write(f)
+            write_config(config)
 
         # Set the clobbered parameter to True,
         # preventing subsequent method calls
         self._clobbered = True
 
-        mod_logger.info("Clobbered PARS {name:s}".format(name=self.name))
+        mod_logger.info("Clobbered PARS %s", self.name)
 
 
 # noinspection PyPropertyAccess,PyAttributeOutsideInit
@@ -897,13 +962,23 @@ class Knot(aws.NamedObject):
 
         image_tags = image_tags if image_tags else [name]
 
-        # Check for existence of this knot in the config file
-        config = configparser.ConfigParser()
-
+        # Check for existence of this knot in the config file. Take a
+        # snapshot of what we need, since the shared config is modified by
+        # the PARS and docker image threads while this knot is set up.
         with rlock:
-            config.read(get_config_file())
+            config = read_config()
+            knot_conf = (
+                dict(config.items(self._knot_name))
+                if config.has_section(self._knot_name)
+                else None
+            )
+            known_repos = (
+                set(config.options("docker-repos"))
+                if config.has_section("docker-repos")
+                else set()
+            )
 
-        if self._knot_name in config.sections():
+        if knot_conf is not None:
             if any(
                 [
                     pars,
@@ -944,58 +1019,50 @@ class Knot(aws.NamedObject):
                     "instantiate a new one with your input arguments."
                 )
 
-            mod_logger.info("Found knot {name:s} in config".format(name=name))
+            mod_logger.info("Found knot %s in config", name)
 
-            self._region = config.get(self._knot_name, "region")
-            self._profile = config.get(self._knot_name, "profile")
+            self._region = knot_conf["region"]
+            self._profile = knot_conf["profile"]
             self.check_profile_and_region()
 
-            pars_name = config.get(self._knot_name, "pars")
+            pars_name = knot_conf["pars"]
             self._pars = Pars(name=pars_name)
-            mod_logger.info(
-                "Knot {name:s} adopted PARS "
-                "{p:s}".format(name=self.name, p=self.pars.name)
-            )
+            mod_logger.info("Knot %s adopted PARS %s", self.name, self.pars.name)
 
-            image_name = config.get(self._knot_name, "docker-image")
+            image_name = knot_conf["docker-image"]
             self._docker_image = dockerimage.DockerImage(name=image_name)
-            mod_logger.info(
-                "Knot {name:s} adopted docker image {dr:s}"
-                "".format(name=self.name, dr=image_name)
-            )
+            mod_logger.info("Knot %s adopted docker image %s", self.name, image_name)
 
             if not self.docker_image.images:
                 self.docker_image.build(tags=image_tags, nocache=no_image_cache)
                 mod_logger.info(
-                    "knot {name:s} built docker image {i!s}"
-                    "".format(name=self.name, i=self.docker_image.images)
+                    "knot %s built docker image %s", self.name, self.docker_image.images
                 )
 
             if self.docker_image.repo_uri is None:
-                repo_name = config.get(self._knot_name, "docker-repo")
+                repo_name = knot_conf["docker-repo"]
                 self._docker_repo = aws.DockerRepo(name=repo_name)
                 mod_logger.info(
-                    "Knot {name:s} adopted docker repository "
-                    "{dr:s}".format(name=self.name, dr=repo_name)
+                    "Knot %s adopted docker repository %s", self.name, repo_name
                 )
 
                 self.docker_image.push(repo=self.docker_repo)
                 mod_logger.info(
-                    "Knot {name:s} pushed docker image {dr:s}"
-                    "".format(name=self.name, dr=self.docker_image.name)
+                    "Knot %s pushed docker image %s", self.name, self.docker_image.name
                 )
             else:
                 self._docker_repo = None
 
-            self._stack_id = config.get(self._knot_name, "stack-id")
+            self._stack_id = knot_conf["stack-id"]
 
-            if not is_valid_stack(self._stack_id):
+            # Reuse the stack description rather than describing it twice
+            stack = _describe_valid_stack(self._stack_id)
+            if stack is None:
                 # Remove this section from the config file
                 with rlock:
-                    config.read(get_config_file())
+                    config = read_config()
                     config.remove_section(self._knot_name)
-                    with open(get_config_file(), "w") as f:
-                        config.write(f)
+                    write_config(config)
                 raise aws.ResourceDoesNotExistException(
                     "The Knot cloudformation stack that you requested "
                     "does not exist. Cloudknot has deleted this Knot from "
@@ -1004,10 +1071,7 @@ class Knot(aws.NamedObject):
                     self._stack_id,
                 )
 
-            response = aws.clients["cloudformation"].describe_stacks(
-                StackName=self._stack_id
-            )
-            outs = response.get("Stacks")[0]["Outputs"]
+            outs = stack["Outputs"]
 
             job_def_arn = _stack_out("JobDefinition", outs)
             response = aws.clients["batch"].describe_job_definitions(
@@ -1033,9 +1097,9 @@ class Knot(aws.NamedObject):
             self._compute_environment = _stack_out("ComputeEnvironment", outs)
             self._job_queue = _stack_out("JobQueue", outs)
 
-            conf_jd = config.get(self._knot_name, "job-definition")
-            conf_ce = config.get(self._knot_name, "compute-environment")
-            conf_jq = config.get(self._knot_name, "job-queue")
+            conf_jd = knot_conf["job-definition"]
+            conf_ce = knot_conf["compute-environment"]
+            conf_jq = knot_conf["job-queue"]
 
             if not all(
                 [
@@ -1050,7 +1114,7 @@ class Knot(aws.NamedObject):
                     "Please try a different name."
                 )
 
-            self._job_ids = config.get(self._knot_name, "job_ids").split()
+            self._job_ids = knot_conf["job_ids"].split()
             self._jobs = [aws.BatchJob(job_id=jid) for jid in self.job_ids]
         else:
             if pars and not isinstance(pars, Pars):
@@ -1090,49 +1154,14 @@ class Knot(aws.NamedObject):
             )
             job_queue_name = job_queue_name if job_queue_name else name + "-ck-jq"
 
-            # Validate job_def_vcpus input
-            if job_def_vcpus:
-                cpus = int(job_def_vcpus)
-                if cpus < 1:
-                    raise aws.CloudknotInputError("vcpus must be positive")
-                else:
-                    job_def_vcpus = cpus
-            else:
-                job_def_vcpus = 1
-
-            # Set default memory
-            try:
-                memory = int(memory) if memory is not None else 8000
-                if memory < 1:
-                    raise aws.CloudknotInputError("memory must be positive")
-            except ValueError:
-                raise aws.CloudknotInputError("memory must be an integer")
-
-            # Set default n_gpus
-            try:
-                n_gpus = int(n_gpus) if n_gpus is not None else 0
-                if n_gpus < 0:
-                    raise aws.CloudknotInputError("n_gpus must non-negative")
-            except ValueError:
-                raise aws.CloudknotInputError("n_gpus must be an integer")
-
-            # Validate retries input
-            try:
-                retries = int(retries) if retries is not None else 1
-                if retries < 1:
-                    raise aws.CloudknotInputError("retries must be > 0")
-                elif retries > 10:
-                    raise aws.CloudknotInputError("retries must be < 10")
-            except ValueError:
-                raise aws.CloudknotInputError("retries must be an integer")
-
-            # Validate priority
-            try:
-                priority = int(priority) if priority is not None else 1
-                if priority < 1:
-                    raise aws.CloudknotInputError("priority must be positive")
-            except ValueError:
-                raise aws.CloudknotInputError("priority must be an integer")
+            # Validate integer inputs, substituting defaults
+            job_def_vcpus = _validated_int(
+                job_def_vcpus if job_def_vcpus else None, "job_def_vcpus", 1, 1
+            )
+            memory = _validated_int(memory, "memory", 8000, 1)
+            n_gpus = _validated_int(n_gpus, "n_gpus", 0, 0)
+            retries = _validated_int(retries, "retries", 1, 1, maximum=10)
+            priority = _validated_int(priority, "priority", 1, 1)
 
             # Set resource type, default to 'EC2' unless bid_percentage
             # is provided
@@ -1141,9 +1170,9 @@ class Knot(aws.NamedObject):
             else:
                 resource_type = "EC2"
 
-            min_vcpus = int(min_vcpus) if min_vcpus else 0
-            if min_vcpus < 0:
-                raise aws.CloudknotInputError("min_vcpus must be non-negative")
+            min_vcpus = _validated_int(
+                min_vcpus if min_vcpus else None, "min_vcpus", 0, 0
+            )
 
             if min_vcpus > 0:
                 mod_logger.warning(
@@ -1154,15 +1183,8 @@ class Knot(aws.NamedObject):
                     "a compute environment with min_vcpus set to zero."
                 )
 
-            # Validate desired_vcpus input, default to 8
-            desired_vcpus = int(desired_vcpus) if desired_vcpus is not None else 8
-            if desired_vcpus < 0:
-                raise aws.CloudknotInputError("desired_vcpus must be " "non-negative")
-
-            # Validate max_vcpus, default to 256
-            max_vcpus = int(max_vcpus) if max_vcpus is not None else 256
-            if max_vcpus < 0:
-                raise aws.CloudknotInputError("max_vcpus must be non-negative")
+            desired_vcpus = _validated_int(desired_vcpus, "desired_vcpus", 8, 0)
+            max_vcpus = _validated_int(max_vcpus, "max_vcpus", 256, 0)
 
             if volume_size is not None and image_id is not None:
                 raise aws.CloudknotInputError(
@@ -1224,11 +1246,7 @@ class Knot(aws.NamedObject):
                 if input_pars:
                     pars_ = input_pars
 
-                    mod_logger.info(
-                        "knot {name:s} adopted PARS {p:s}".format(
-                            name=knot_name, p=pars_.name
-                        )
-                    )
+                    mod_logger.info("knot %s adopted PARS %s", knot_name, pars_.name)
                     pars_cleanup_ = False
                 else:
                     try:
@@ -1240,11 +1258,7 @@ class Knot(aws.NamedObject):
                             use_default_vpc=False,
                         )
 
-                    mod_logger.info(
-                        "knot {name:s} created PARS {p:s}".format(
-                            name=knot_name, p=pars_.name
-                        )
-                    )
+                    mod_logger.info("knot %s created PARS %s", knot_name, pars_.name)
                     pars_cleanup_ = True
 
                 return pars_, pars_cleanup_
@@ -1266,8 +1280,7 @@ class Knot(aws.NamedObject):
                     di = input_docker_image
 
                     mod_logger.info(
-                        "Knot {name:s} adopted docker image {i:s}"
-                        "".format(name=knot_name, i=docker_image.name)
+                        "Knot %s adopted docker image %s", knot_name, docker_image.name
                     )
                 else:
                     # Create and build the docker image
@@ -1283,8 +1296,7 @@ class Knot(aws.NamedObject):
                 if not di.images:
                     di.build(tags=tags, nocache=no_image_cache)
                     mod_logger.info(
-                        "knot {name:s} built docker image {i!s}"
-                        "".format(name=knot_name, i=di.images)
+                        "knot %s built docker image %s", knot_name, di.images
                     )
 
                 if di.repo_uri is None:
@@ -1296,7 +1308,7 @@ class Knot(aws.NamedObject):
                     # parameters. If we do that, we don't want to leave a
                     # bunch of newly created resources around so keep track of
                     # whether this repo was created or adopted.
-                    if config.has_option("docker-repos", repo_name_):
+                    if config.optionxform(repo_name_) in known_repos:
                         # Pre-existing repo, no cleanup necessary
                         repo_cleanup_ = False
                     elif repo_name_ == aws.get_ecr_repo():
@@ -1308,16 +1320,16 @@ class Knot(aws.NamedObject):
                     dr = aws.DockerRepo(name=repo_name_)
 
                     mod_logger.info(
-                        "knot {name:s} created/adopted docker repo "
-                        "{r:s}".format(name=knot_name, r=dr.name)
+                        "knot %s created/adopted docker repo %s", knot_name, dr.name
                     )
 
                     # Push to remote repo
                     di.push(repo=dr)
 
                     mod_logger.info(
-                        "knot {name:s} pushed it's docker image to the repo "
-                        "{r:s}".format(name=knot_name, r=dr.name)
+                        "knot %s pushed it's docker image to the repo %s",
+                        knot_name,
+                        dr.name,
                     )
                 else:
                     repo_cleanup_ = False
@@ -1535,10 +1547,8 @@ class Knot(aws.NamedObject):
 
             # Save the new Knot resources in config object
             # Use config.set() for python 2.7 compatibility
-            config = configparser.ConfigParser()
-
             with rlock:
-                config.read(get_config_file())
+                config = read_config()
                 config.add_section(self._knot_name)
                 config.set(self._knot_name, "region", self.region)
                 config.set(self._knot_name, "profile", self.profile)
@@ -1558,8 +1568,7 @@ class Knot(aws.NamedObject):
                 config.set(self._knot_name, "job_ids", "")
 
                 # Save config to file
-                with open(get_config_file(), "w") as f:
-                    config.write(f)
+                write_config(config)
 
     # Declare read-only properties
     @property
@@ -1737,18 +1746,15 @@ class Knot(aws.NamedObject):
         if not these_jobs:
             return []
 
-        config = configparser.ConfigParser()
-
         with rlock:
-            config.read(get_config_file())
+            config = read_config()
             config.set(self._knot_name, "job_ids", " ".join(self.job_ids))
             # Save config to file
-            with open(get_config_file(), "w") as f:
-                config.write(f)
+            write_config(config)
 
         # Increase the max_pool_connections in the boto3 clients to prevent
         # https://github.com/boto/botocore/issues/766
-        aws.refresh_clients(max_pool=max_threads)
+        aws.base_classes._refresh_clients(max_pool=max_threads)
 
         executor = ThreadPoolExecutor(max(min(len(these_jobs), max_threads), 2))
 
@@ -1824,7 +1830,7 @@ class Knot(aws.NamedObject):
 
         aws.clients["cloudformation"].delete_stack(StackName=self._stack_id)
 
-        if clobber_repo:
+        def _clobber_repo_task():
             dr = self.docker_repo
             if dr and dr.name != aws.get_ecr_repo():
                 # if the docker repo instance exists and it is not the
@@ -1852,25 +1858,35 @@ class Knot(aws.NamedObject):
                     repo = aws.DockerRepo(name=repo_name)
                     repo.clobber()
 
-        if clobber_image:
-            self.docker_image.clobber()
-
-        if clobber_pars:
+        def _clobber_pars_task():
             waiter = aws.clients["cloudformation"].get_waiter("stack_delete_complete")
             waiter.wait(StackName=self.stack_id, WaiterConfig={"Delay": 10})
             self.pars.clobber()
 
-        # Remove this section from the config file
-        config = configparser.ConfigParser()
+        # The repo, image, and PARS cleanups are independent of one another,
+        # so run them concurrently. In particular, the repo and image
+        # cleanups no longer wait on the (slow) knot stack deletion.
+        with ThreadPoolExecutor(3) as e:
+            futures = []
+            if clobber_repo:
+                futures.append(e.submit(_clobber_repo_task))
+            if clobber_image:
+                futures.append(e.submit(self.docker_image.clobber))
+            if clobber_pars:
+                futures.append(e.submit(_clobber_pars_task))
+
+        # Surface any exceptions from the cleanup tasks
+        for future in futures:
+            future.result()
 
+        # Remove this section from the config file
         with rlock:
-            config.read(get_config_file())
+            config = read_config()
             config.remove_section(self._knot_name)
-            with open(get_config_file(), "w") as f:
-                config.write(f)
+            write_config(config)
 
         # Set the clobbered parameter to True,
         # preventing subsequent method calls
         self._clobbered = True
 
-        mod_logger.info("Clobbered Knot {name:s}".format(name=self.name))
+        mod_logger.info("Clobbered Knot %s", self.name)
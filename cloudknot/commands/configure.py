@@ -1,7 +1,7 @@
-import docker
 import logging
-import os
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from awscli.customizations.configure.configure import InteractivePrompter
 
 from .base import Base
@@ -15,61 +15,57 @@ from ..aws import (
     set_ecr_repo,
 )
 from ..config import add_resource
+from ..dockerimage import _docker_client, _drain_stream, _ecr_login
 
 module_logger = logging.getLogger(__name__)
-is_windows = os.name == "nt"
 
+# Importing readline gives the configure prompts line editing and history
+try:
+    import readline  # noqa: F401
+except ImportError:  # pragma: nocover
+    pass
 
-def pull_and_push_base_images(region, profile, ecr_repo):
+
+def pull_and_push_base_images(ecr_repo):
+    # The ECR login and repo lookup go through the shared AWS clients, which
+    # already use the region and profile chosen at the prompts.
+    #
     # Use docker low-level APIClient for tagging
-    c = docker.from_env().api
+    c = _docker_client().api
     # And the image client for pulling and pushing
-    cli = docker.from_env().images
+    cli = _docker_client().images
 
     # Build the python base image so that later build commands are faster
     py_base = "python:3"
     ecr_tag = "python3"
-    module_logger.info("Pulling base image {b:s}".format(b=py_base))
-    cli.pull(py_base)
-
-    if profile != "from-env":
-        cmd = [
-            "aws",
-            "ecr",
-            "get-login",
-            "--no-include-email",
-            "--region",
-            region,
-            "--profile",
-            profile,
-        ]
-    else:
-        cmd = ["aws", "ecr", "get-login", "--no-include-email", "--region", region]
-
-    # Refresh the aws ecr login credentials
-    login_cmd = subprocess.check_output(cmd, shell=is_windows)
+    module_logger.info("Pulling base image %s", py_base)
 
-    # Login
-    login_cmd = login_cmd.decode("ASCII").rstrip("\n").split(" ")
-    fnull = open(os.devnull, "w")
-    subprocess.call(login_cmd, stdout=fnull, stderr=subprocess.STDOUT, shell=is_windows)
+    # The image pull, the ECR login and the repo lookup are independent,
+    # so let the (fast) ECR calls run while the (slow) pull is underway
+    with ThreadPoolExecutor(3) as e:
+        pull_future = e.submit(cli.pull, py_base)
+        login_future = e.submit(_ecr_login)
+        repo_future = e.submit(DockerRepo, name=ecr_repo)
 
-    repo = DockerRepo(name=ecr_repo)
+    pull_future.result()
+    login_future.result()
+    repo = repo_future.result()
 
     # Log tagging info
-    module_logger.info("Tagging base image {name:s}".format(name=py_base))
+    module_logger.info("Tagging base image %s", py_base)
 
     # Tag it with the most recently added image_name
     c.tag(image=py_base, repository=repo.repo_uri, tag=ecr_tag)
 
     # Log push info
     module_logger.info(
-        "Pushing base image {name:s} to ecr repository {repo:s}"
-        "".format(name=py_base, repo=repo.repo_uri)
+        "Pushing base image %s to ecr repository %s", py_base, repo.repo_uri
     )
 
-    for line in cli.push(repository=repo.repo_uri, tag=ecr_tag, stream=True):
-        module_logger.debug(line)
+    _drain_stream(
+        cli.push(repository=repo.repo_uri, tag=ecr_tag, stream=True),
+        logger=module_logger,
+    )
 
 
 class Configure(Base):
@@ -84,7 +80,9 @@ class Configure(Base):
             "please follow the prompts to start using cloudknot.\n"
         )
 
-        subprocess.call("aws configure".split(" "), shell=is_windows)
+        # Resolve the executable ourselves (e.g. aws.cmd on Windows) so that
+        # we never need to start a shell just to find it
+        subprocess.call([shutil.which("aws") or "aws", "configure"])
 
         print(
             "\n`aws configure` complete. Resuming configuration with "
@@ -99,8 +97,8 @@ class Configure(Base):
         ]
 
         values = {}
+        prompter = InteractivePrompter()
         for config_name, prompt_text, getter, setter in values_to_prompt:
-            prompter = InteractivePrompter()
             default_value = getter()
 
             new_value = prompter.get_value(
@@ -123,10 +121,6 @@ class Configure(Base):
             "repository on AWS ECR."
         )
 
-        pull_and_push_base_images(
-            region=values["region"],
-            profile=values["profile"],
-            ecr_repo=values["ecr_repo"],
-        )
+        pull_and_push_base_images(ecr_repo=values["ecr_repo"])
 
         print("All done.\n")
@@ -11,10 +11,14 @@ references to its state in the config file.
 """
 import botocore
 import configparser
+import contextlib
 import docker
 import errno
 import logging
 import os
+import stat
+import tempfile
+import threading
 from threading import RLock
 
 from . import aws
@@ -24,6 +28,9 @@ __all__ = [
     "prune_stacks",
     "prune",
     "get_config_file",
+    "read_config",
+    "write_config",
+    "batch_writes",
     "add_resource",
     "remove_resource",
     "verify_sections",
@@ -45,14 +52,13 @@ def get_config_file():
     config_file : string
         Path to cloudknot config file
     """
-    try:
-        # Get config file from environment variable
-        env_file = os.environ["CLOUDKNOT_CONFIG_FILE"]
+    # Get config file from environment variable
+    env_file = os.environ.get("CLOUDKNOT_CONFIG_FILE")
+    if env_file is not None:
         config_file = os.path.abspath(env_file)
-    except KeyError:
+    else:
         # Fallback on default config file path
-        home = os.path.expanduser("~")
-        config_file = os.path.join(home, ".aws", "cloudknot")
+        config_file = os.path.join(os.path.expanduser("~"), ".aws", "cloudknot")
 
     with rlock:
         if not os.path.isfile(config_file):
@@ -75,11 +81,158 @@ def get_config_file():
                 "Created new cloudknot config file at {path:s}".format(path=config_file)
             )
 
-    mod_logger.debug("Using cloudknot config file {path:s}".format(path=config_file))
+    # get_config_file is called on nearly every config access, so let the
+    # logger defer string formatting until the record is actually emitted
+    mod_logger.debug("Using cloudknot config file %s", config_file)
 
     return config_file
 
 
+# Parsed config file, reused until the file changes on disk
+_config_cache = {"path": None, "stamp": None, "parser": None}
+
+# Per-thread nesting depth of batch_writes() blocks
+_batch = threading.local()
+
+
+def _batching():
+    return getattr(_batch, "depth", 0) > 0
+
+
+def _invalidate_config_cache():
+    # Force the next read_config() to re-parse the file on disk
+    _config_cache.update(path=None, stamp=None, parser=None)
+
+
+def _file_stamp(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_config():
+    """
+    Return the parsed cloudknot config file.
+
+    The parsed file is cached in memory and only re-read when the config
+    file's modification time or size changes, e.g. when another process
+    writes to it.
+
+    The returned ConfigParser is shared, so callers that modify it should
+    hold `rlock` and persist their changes with `write_config`.
+
+    Returns
+    -------
+    config : configparser.ConfigParser
+        The parsed cloudknot config file
+    """
+    config_file = get_config_file()
+
+    with rlock:
+        # Inside batch_writes() the cached parser holds unsaved changes
+        if _batching() and _config_cache["path"] == config_file:
+            return _config_cache["parser"]
+
+        stamp = _file_stamp(config_file)
+        if (
+            _config_cache["parser"] is None
+            or _config_cache["path"] != config_file
+            or _config_cache["stamp"] != stamp
+        ):
+            config = configparser.ConfigParser()
+            config.read(config_file)
+            _config_cache.update(path=config_file, stamp=stamp, parser=config)
+
+        return _config_cache["parser"]
+
+
+#: buffer size used when writing the config file
+_WRITE_BUFFER_SIZE = 1 << 16
+
+
+def write_config(config):
+    """
+    Write `config` to the cloudknot config file.
+
+    The file is replaced atomically, so concurrent readers see either the
+    old or the new config, never a partial write.
+
+    The written ConfigParser becomes the cached config returned by
+    `read_config`, so the next read does not need to re-parse the file.
+    Inside a `batch_writes` block, the write is deferred until the block
+    exits.
+
+    Parameters
+    ----------
+    config : configparser.ConfigParser
+        The config to save
+    """
+    config_file = get_config_file()
+
+    with rlock:
+        if _batching() and _config_cache["path"] == config_file:
+            _config_cache["parser"] = config
+            return
+
+        # Write to a temporary file and move it into place, so that other
+        # processes never read a partially written config file
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(config_file), prefix=".cloudknot-", suffix=".tmp"
+        )
+        try:
+            # ConfigParser.write issues one small write per line; a large
+            # buffer turns the whole config into a single write syscall
+            with os.fdopen(fd, "w", buffering=_WRITE_BUFFER_SIZE) as f:
+                config.write(f)
+
+            # Keep the permissions of the file that we are replacing
+            try:
+                os.chmod(tmp_file, stat.S_IMODE(os.stat(config_file).st_mode))
+            except FileNotFoundError:  # pragma: nocover
+                pass
+
+            os.replace(tmp_file, config_file)
+        except BaseException:
+            try:
+                os.remove(tmp_file)
+            except OSError:  # pragma: nocover
+                pass
+            # The cached parser may hold the edits that failed to save
+            _invalidate_config_cache()
+            raise
+
+        _config_cache.update(
+            path=config_file, stamp=_file_stamp(config_file), parser=config
+        )
+
+
+@contextlib.contextmanager
+def batch_writes():
+    """
+    Defer writes to the cloudknot config file until the end of the block.
+
+    Within the block, `add_resource`, `remove_resource` and `write_config`
+    only update the cached config in memory. The config file is written
+    once when the outermost block exits. If the outermost block exits with
+    an exception, the pending changes are discarded and the config file is
+    left untouched. `rlock` is held for the duration of the block, so keep
+    slow operations out of it.
+    """
+    with rlock:
+        read_config()
+        depth = getattr(_batch, "depth", 0)
+        _batch.depth = depth + 1
+        try:
+            yield
+        except BaseException:
+            _batch.depth = depth
+            if not depth:
+                _invalidate_config_cache()
+            raise
+        _batch.depth = depth
+        if not depth:
+            write_config(_config_cache["parser"])
+
+
 def add_resource(section, option, value):
     """
     Add a resource to the cloudknot config file.
@@ -95,16 +248,12 @@ def add_resource(section, option, value):
     value : string
         Config value to add (i.e. second item in key:value pair)
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     with rlock:
-        config.read(config_file)
+        config = read_config()
         if section not in config.sections():
             config.add_section(section)
         config.set(section=section, option=option, value=value)
-        with open(config_file, "w") as f:
-            config.write(f)
+        write_config(config)
 
 
 def remove_resource(section, option):
@@ -119,25 +268,19 @@ def remove_resource(section, option):
     option : string
         Config option to remove (i.e. the key in the key:value pair)
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
-
     with rlock:
-        config.read(config_file)
+        config = read_config()
         try:
             config.remove_option(section, option)
         except configparser.NoSectionError:
             pass
-        with open(config_file, "w") as f:
-            config.write(f)
+        write_config(config)
 
 
 def verify_sections():
     """Verify config sections, remove ones that don't belong."""
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         approved_sections = [
             "aws",
@@ -157,18 +300,31 @@ def verify_sections():
             if not section_approved(section):
                 config.remove_section(section)
 
-        with open(config_file, "w") as f:
-            config.write(f)
+        write_config(config)
 
 
-def is_valid_stack(stack_id):
+def _describe_valid_stack(stack_id):
+    """
+    Describe a CloudFormation stack if it exists and is usable.
+
+    Parameters
+    ----------
+    stack_id : string
+        The stack name or ID
+
+    Returns
+    -------
+    stack : dict or None
+        The stack description from describe_stacks, or None if the stack
+        does not exist or is in a failed or deleted state
+    """
     try:
         response = aws.clients["cloudformation"].describe_stacks(StackName=stack_id)
     except aws.clients["cloudformation"].exceptions.ClientError as e:
         error_code = e.response.get("Error").get("Message")
         no_stack_code = "Stack with id {0:s} does not exist" "".format(stack_id)
         if error_code == no_stack_code:
-            return False
+            return None
         else:  # pragma: nocover
             raise e
 
@@ -186,9 +342,13 @@ def is_valid_stack(stack_id):
     ]
 
     if no_stack:
-        return False
+        return None
+
+    return response.get("Stacks")[0]
 
-    return True
+
+def is_valid_stack(stack_id):
+    return _describe_valid_stack(stack_id) is not None
 
 
 def prune_stacks():
@@ -198,13 +358,11 @@ def prune_stacks():
     Verify that the pars/knot sections in the config file refer to actual
     CloudFormation stacks that exist on AWS. If not, remove from config file.
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
     old_profile = aws.get_profile()
     old_region = aws.get_region()
 
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         for section in config.sections():
             if section.split(" ", 1)[0] in ["knot", "pars"]:
@@ -220,8 +378,7 @@ def prune_stacks():
                         "Removed {name:s} from your config file.".format(name=section)
                     )
 
-        with open(config_file, "w") as f:
-            config.write(f)
+        write_config(config)
 
     aws.set_profile(old_profile)
     aws.set_region(old_region)
@@ -234,12 +391,11 @@ def prune_repos():
     Verify that the ECR repo sections in the config file refer to actual
     ECR repos that exist on AWS. If not, remove from config file.
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
     old_profile = aws.get_profile()
     old_region = aws.get_region()
 
-    config.read(config_file)
+    with rlock:
+        config = read_config()
 
     repo_sections = [
         sec for sec in config.sections() if sec.split(" ")[0] == "docker-repos"
@@ -249,7 +405,8 @@ def prune_repos():
         region = section.split(" ")[2]
         aws.set_profile(profile)
         aws.set_region(region)
-        for repo_name, repo_uri in config[section].items():
+        # remove_resource edits the cached config, so iterate over a copy
+        for repo_name, repo_uri in list(config[section].items()):
             remove_repo = False
             try:
                 # If repo exists, retrieve its info
@@ -273,7 +430,9 @@ def prune_repos():
                     raise e
 
             if remove_repo:
-                # Remove this section from the config file
+                # Remove this section from the config file and forget any
+                # cached lookup of the missing repo
+                aws.ecr._clear_repo_cache()
                 remove_resource(section, repo_name)
                 mod_logger.info(
                     "Removed ECR repo {name:s} from your config file.".format(
@@ -292,12 +451,11 @@ def prune_batch_jobs():
     Verify that the batch jobs in the config file refer to actual
     batch jobs that exist on AWS. If not, remove from config file.
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
     old_profile = aws.get_profile()
     old_region = aws.get_region()
 
-    config.read(config_file)
+    with rlock:
+        config = read_config()
 
     repo_sections = [
         sec for sec in config.sections() if sec.split(" ")[0] == "batch-jobs"
@@ -307,7 +465,8 @@ def prune_batch_jobs():
         region = section.split(" ")[2]
         aws.set_profile(profile)
         aws.set_region(region)
-        for job_id in config[section].keys():
+        # remove_resource edits the cached config, so iterate over a copy
+        for job_id in list(config[section].keys()):
             response = aws.clients["batch"].describe_jobs(jobs=[job_id])
             if not response.get("jobs"):
                 remove_resource(section, job_id)
@@ -327,13 +486,11 @@ def prune_images():
     docker images that refer either to local resources or to images that
     exist on AWS. If not, remove from config file.
     """
-    config_file = get_config_file()
-    config = configparser.ConfigParser()
     old_profile = aws.get_profile()
     old_region = aws.get_region()
 
     with rlock:
-        config.read(config_file)
+        config = read_config()
 
         image_sections = [
             sec for sec in config.sections() if sec.split(" ")[0] == "docker-image"
@@ -390,8 +547,7 @@ def prune_images():
                     "Removed {name:s} from your config file.".format(name=section)
                 )
 
-        with open(config_file, "w") as f:
-            config.write(f)
+        write_config(config)
 
     aws.set_profile(old_profile)
     aws.set_region(old_region)
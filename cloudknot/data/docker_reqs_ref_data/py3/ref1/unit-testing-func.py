@@ -1,53 +1,66 @@
 #!/usr/bin/env python3
 import boto3
 import cloudpickle
+import io
 import os
 import pickle
 from argparse import ArgumentParser
-from functools import wraps
+from functools import lru_cache, wraps
+
+
+# Results at least this large are uploaded in parts rather than one PUT
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _s3_client():
+    return boto3.client("s3")
 
 
 def pickle_to_s3(server_side_encryption=None, array_job=True):
     def real_decorator(f):
+        # The job's environment is fixed for its lifetime, so build the S3
+        # client and output key once rather than on every call
+        s3 = _s3_client()
+        bucket = os.environ.get("CLOUDKNOT_JOBS_S3_BUCKET")
+
+        if array_job:
+            array_index = os.environ.get("AWS_BATCH_JOB_ARRAY_INDEX")
+        else:
+            array_index = "0"
+
+        jobid = os.environ.get("AWS_BATCH_JOB_ID")
+
+        if array_job:
+            jobid = jobid.split(":")[0]
+
+        key = "cloudknot.jobs/{jobdef}/{jobid}/{index}/{attempt:03d}/output.pickle".format(
+            jobdef=os.environ.get("CLOUDKNOT_S3_JOBDEF_KEY"),
+            jobid=jobid,
+            index=array_index,
+            attempt=int(os.environ.get("AWS_BATCH_JOB_ATTEMPT")),
+        )
+
         @wraps(f)
         def wrapper(*args, **kwargs):
-            s3 = boto3.client("s3")
-            bucket = os.environ.get("CLOUDKNOT_JOBS_S3_BUCKET")
-
-            if array_job:
-                array_index = os.environ.get("AWS_BATCH_JOB_ARRAY_INDEX")
-            else:
-                array_index = "0"
-
-            jobid = os.environ.get("AWS_BATCH_JOB_ID")
-
-            if array_job:
-                jobid = jobid.split(":")[0]
-
-            key = "/".join(
-                [
-                    "cloudknot.jobs",
-                    os.environ.get("CLOUDKNOT_S3_JOBDEF_KEY"),
-                    jobid,
-                    array_index,
-                    "{0:03d}".format(int(os.environ.get("AWS_BATCH_JOB_ATTEMPT"))),
-                    "output.pickle",
-                ]
-            )
-
             result = f(*args, **kwargs)
 
             # Only pickle output and write to S3 if it is not None
             if result is not None:
                 pickled_result = cloudpickle.dumps(result, protocol=3)
-                if server_side_encryption is None:
-                    s3.put_object(Bucket=bucket, Body=pickled_result, Key=key)
-                else:
+                extra_args = {}
+                if server_side_encryption is not None:
+                    extra_args["ServerSideEncryption"] = server_side_encryption
+
+                if len(pickled_result) < _MULTIPART_THRESHOLD:
                     s3.put_object(
-                        Bucket=bucket,
-                        Body=pickled_result,
-                        Key=key,
-                        ServerSideEncryption=server_side_encryption,
+                        Bucket=bucket, Body=pickled_result, Key=key, **extra_args
+                    )
+                else:
+                    # Let boto3's transfer manager upload large results as
+                    # concurrent multipart chunks
+                    s3.upload_fileobj(
+                        io.BytesIO(pickled_result), bucket, key, ExtraArgs=extra_args
                     )
 
         return wrapper
@@ -121,7 +134,7 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    s3 = boto3.client("s3")
+    s3 = _s3_client()
     bucket = args.bucket
 
     jobid = os.environ.get("AWS_BATCH_JOB_ID")
@@ -1,12 +1,14 @@
 """Create, build, push, and manage Docker images for use in Cloudknot."""
-import configparser
+import base64
+import collections
 import docker
+import functools
 import inspect
 import json
 import logging
 import os
 import re
-import subprocess
+import shutil
 import tempfile
 from pipreqs import pipreqs
 from string import Template
@@ -14,22 +16,94 @@ from string import Template
 from . import aws
 from . import config as ckconfig
 from .aws.base_classes import (
-    get_region,
-    get_profile,
     ResourceClobberedException,
     CloudknotInputError,
     CloudknotConfigurationError,
 )
-from .config import get_config_file, rlock
+from .config import read_config, rlock, write_config
 
 __all__ = ["DockerImage", "DEFAULT_PICKLE_PROTOCOL"]
 
 
 mod_logger = logging.getLogger(__name__)
-is_windows = os.name == "nt"
 DEFAULT_PICKLE_PROTOCOL = 3
 
 
+_DOCKER_MISSING_MSG = (
+    "It looks like you don't have Docker installed or running. Please go "
+    "to https://docs.docker.com/engine/installation/ to install it. Once "
+    "installed, make sure that the Docker daemon is running before using "
+    "cloudknot."
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _verify_docker():
+    """Raise a RuntimeError if the docker CLI is not available.
+
+    The check runs at most once per process, the first time that cloudknot
+    needs Docker, rather than on every `import cloudknot`. Set the
+    CLOUDKNOT_SKIP_DOCKER_CHECK environment variable to skip it.
+    """
+    if os.environ.get("CLOUDKNOT_SKIP_DOCKER_CHECK"):
+        return
+
+    # shutil.which only returns paths that pass os.access(path, X_OK), so
+    # this finds an executable docker CLI without forking `docker -v`. An
+    # unreachable daemon is reported by the first real docker call instead.
+    if shutil.which("docker") is None:
+        raise RuntimeError(_DOCKER_MISSING_MSG)
+
+
+@functools.lru_cache(maxsize=1)
+def _docker_client():
+    """Return a docker client, reused across calls.
+
+    docker.from_env() reads the environment and negotiates the API version
+    with the daemon, so we only do that once per process.
+    """
+    _verify_docker()
+    return docker.from_env()
+
+
+def _drain_stream(stream, logger=mod_logger):
+    """Consume a docker progress stream, logging each line at DEBUG level.
+
+    A push yields thousands of progress lines, so when DEBUG is disabled we
+    exhaust the stream without building a log record for each line.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        for line in stream:
+            logger.debug(line)
+    else:
+        collections.deque(stream, maxlen=0)
+
+
+def _ecr_login():
+    """Log the shared docker client in to AWS ECR.
+
+    The ECR authorization token is base64 encoded "user:password". We split
+    the raw bytes and decode only the two halves.
+    """
+    response = aws.clients["ecr"].get_authorization_token()
+    auth_data = response["authorizationData"][0]
+    token = base64.b64decode(auth_data["authorizationToken"])
+    username, _, password = token.partition(b":")
+
+    try:
+        _docker_client().login(
+            username=username.decode(),
+            password=password.decode(),
+            registry=auth_data["proxyEndpoint"],
+        )
+    except docker.errors.APIError as e:  # pragma: nocover
+        raise CloudknotConfigurationError(
+            "Unable to login to AWS ECR at {registry:s}: {err!s}".format(
+                registry=auth_data["proxyEndpoint"], err=e
+            )
+        )
+
+
 # noinspection PyPropertyAccess,PyAttributeOutsideInit
 class DockerImage(aws.NamedObject):
     """Class for dockerizing a python script or function.
@@ -189,11 +263,8 @@ class DockerImage(aws.NamedObject):
 
             section_name = "docker-image " + name
 
-            config_file = get_config_file()
-            config = configparser.ConfigParser()
-
             with rlock:
-                config.read(config_file)
+                config = read_config()
 
             if section_name not in config.sections():
                 params_changed = True
@@ -270,12 +341,12 @@ class DockerImage(aws.NamedObject):
                         # Set flag to do all the setup stuff below, warn user
                         params_changed = True
                         mod_logger.warning(
-                            "Found {name:s} in your config file but the input parameters "
-                            "have changed. The updated parameters are {l}. Continuing "
+                            "Found %s in your config file but the input parameters "
+                            "have changed. The updated parameters are %s. Continuing "
                             "with the new input parameters and disregarding any old, "
-                            "potentially conflicting ones.".format(
-                                name=section_name, l=list(conflicting_params.keys())
-                            )
+                            "potentially conflicting ones.",
+                            section_name,
+                            list(conflicting_params.keys()),
                         )
 
                         # Use input params if provided, fall back on config values
@@ -444,26 +515,29 @@ class DockerImage(aws.NamedObject):
 
             # Add to config file
             section_name = "docker-image " + self.name
-            ckconfig.add_resource(section_name, "profile", self.profile)
-            ckconfig.add_resource(section_name, "region", self.region)
-            ckconfig.add_resource(section_name, "function-hash", str(hash(self._func)))
-            ckconfig.add_resource(section_name, "build-path", self.build_path)
-            ckconfig.add_resource(section_name, "script-path", self.script_path)
-            ckconfig.add_resource(section_name, "docker-path", self.docker_path)
-            ckconfig.add_resource(section_name, "req-path", self.req_path)
-            ckconfig.add_resource(section_name, "base-image", self.base_image)
-            ckconfig.add_resource(
-                section_name, "github-imports", " ".join(self.github_installs)
-            )
-            ckconfig.add_resource(
-                section_name, "ignore-installed", str(self.ignore_installed)
-            )
-            ckconfig.add_resource(section_name, "username", self.username)
-            ckconfig.add_resource(section_name, "images", "")
-            ckconfig.add_resource(section_name, "repo-uri", "")
-            ckconfig.add_resource(
-                section_name, "clobber-script", str(self._clobber_script)
-            )
+            with ckconfig.batch_writes():
+                ckconfig.add_resource(section_name, "profile", self.profile)
+                ckconfig.add_resource(section_name, "region", self.region)
+                ckconfig.add_resource(
+                    section_name, "function-hash", str(hash(self._func))
+                )
+                ckconfig.add_resource(section_name, "build-path", self.build_path)
+                ckconfig.add_resource(section_name, "script-path", self.script_path)
+                ckconfig.add_resource(section_name, "docker-path", self.docker_path)
+                ckconfig.add_resource(section_name, "req-path", self.req_path)
+                ckconfig.add_resource(section_name, "base-image", self.base_image)
+                ckconfig.add_resource(
+                    section_name, "github-imports", " ".join(self.github_installs)
+                )
+                ckconfig.add_resource(
+                    section_name, "ignore-installed", str(self.ignore_installed)
+                )
+                ckconfig.add_resource(section_name, "username", self.username)
+                ckconfig.add_resource(section_name, "images", "")
+                ckconfig.add_resource(section_name, "repo-uri", "")
+                ckconfig.add_resource(
+                    section_name, "clobber-script", str(self._clobber_script)
+                )
 
     # Declare read-only properties
     @property
@@ -571,9 +645,7 @@ class DockerImage(aws.NamedObject):
                 )
 
         mod_logger.info(
-            "Wrote python function {func:s} to script {script:s}".format(
-                func=self.name, script=self.script_path
-            )
+            "Wrote python function %s to script %s", self.name, self.script_path
         )
 
     def _write_dockerfile(self):
@@ -612,7 +684,7 @@ class DockerImage(aws.NamedObject):
                     )
                 )
 
-        mod_logger.info("Wrote Dockerfile {path:s}".format(path=self.docker_path))
+        mod_logger.info("Wrote Dockerfile %s", self.docker_path)
 
     def _set_imports(self):
         """Set required imports for the python script at self.script_path."""
@@ -637,7 +709,8 @@ class DockerImage(aws.NamedObject):
                 "Warning, some imports not found by pipreqs. You will "
                 "need to edit the Dockerfile by hand, e.g by installing "
                 "from github. You need to install the following packages "
-                "{missing!s}".format(missing=self.missing_imports)
+                "%s",
+                self.missing_imports,
             )
 
     def build(self, tags, image_name=None, nocache=False):
@@ -681,13 +754,9 @@ class DockerImage(aws.NamedObject):
         self._images += [im for im in images if im not in self.images]
 
         # Use docker low-level APIClient
-        c = docker.from_env()
+        c = _docker_client()
         for im in images:
-            mod_logger.info(
-                "Building image {name:s} with tag {tag:s}".format(
-                    name=im["name"], tag=im["tag"]
-                )
-            )
+            mod_logger.info("Building image %s with tag %s", im["name"], im["tag"])
 
             c.images.build(
                 path=self.build_path,
@@ -700,14 +769,10 @@ class DockerImage(aws.NamedObject):
             )
 
         # Update the config file images list
-        config_file = get_config_file()
-        config = configparser.ConfigParser()
-        with rlock:
-            config.read(config_file)
-
-        # Get list of images in config file
         section_name = "docker-image " + self.name
-        config_images_str = config.get(section_name, "images")
+        with rlock:
+            # Get list of images in config file
+            config_images_str = read_config().get(section_name, "images")
 
         # Split config images into list
         config_images_list = config_images_str.split()
@@ -775,28 +840,6 @@ class DockerImage(aws.NamedObject):
             self._repo_registry_id = repo_info["registry_id"]
             self._repo_name = repo_info["repo_name"]
 
-        fallback = "from_env"
-        if get_profile(fallback=fallback) != fallback:
-            cmd = [
-                "aws",
-                "ecr",
-                "get-login",
-                "--no-include-email",
-                "--region",
-                get_region(),
-                "--profile",
-                get_profile(),
-            ]
-        else:
-            cmd = [
-                "aws",
-                "ecr",
-                "get-login",
-                "--no-include-email",
-                "--region",
-                get_region(),
-            ]
-
         # Determine if we're running in moto for CI
         # by retrieving the account ID
         user = aws.clients["iam"].get_user()["User"]
@@ -813,17 +856,9 @@ class DockerImage(aws.NamedObject):
             }
             for im in self.images:
                 # Log tagging info
-                mod_logger.info(
-                    "Tagging image {name:s} with tag {tag:s}".format(
-                        name=im["name"], tag=im["tag"]
-                    )
-                )
+                mod_logger.info("Tagging image %s with tag %s", im["name"], im["tag"])
                 # Log push info
-                mod_logger.info(
-                    "Pushing image {name:s} with tag {tag:s}".format(
-                        name=im["name"], tag=im["tag"]
-                    )
-                )
+                mod_logger.info("Pushing image %s with tag %s", im["name"], im["tag"])
                 aws.clients["ecr"].put_image(
                     registryId=self._repo_registry_id,
                     repositoryName=self._repo_name,
@@ -831,42 +866,16 @@ class DockerImage(aws.NamedObject):
                     imageTag=im["tag"],
                 )
         else:
-            # Then we're actually doing this thing. Use the Docker CLI
-            # Refresh the aws ecr login credentials
-            login_cmd = subprocess.check_output(cmd, shell=is_windows)
-
-            # Login
-            login_cmd_list = (
-                login_cmd.decode("ASCII").rstrip("\n").rstrip("\r").split(" ")
-            )
-            login_result = subprocess.run(
-                login_cmd_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
-
-            # If login failed, pass error to user
-            if login_result.returncode:  # pragma: nocover
-                raise CloudknotConfigurationError(
-                    "Unable to login to AWS ECR using the command:\n"
-                    "\t{login:s}\nReturned exit code = {code}\n"
-                    "STDOUT: {out:s}\nSTDERR: {err:s}\n".format(
-                        login=login_cmd.decode(),
-                        code=login_result.returncode,
-                        out=login_result.stdout.decode(),
-                        err=login_result.stderr.decode(),
-                    )
-                )
+            # Then we're actually doing this thing. Use the Docker SDK
+            _ecr_login()
 
             # Use docker low-level APIClient for tagging
-            c = docker.from_env().api
+            c = _docker_client().api
             # And the image client for pushing
-            cli = docker.from_env().images
+            cli = _docker_client().images
             for im in self.images:
                 # Log tagging info
-                mod_logger.info(
-                    "Tagging image {name:s} with tag {tag:s}".format(
-                        name=im["name"], tag=im["tag"]
-                    )
-                )
+                mod_logger.info("Tagging image %s with tag %s", im["name"], im["tag"])
 
                 # Tag it with the most recently added image_name
                 c.tag(
@@ -876,16 +885,11 @@ class DockerImage(aws.NamedObject):
                 )
 
                 # Log push info
-                mod_logger.info(
-                    "Pushing image {name:s} with tag {tag:s}".format(
-                        name=im["name"], tag=im["tag"]
-                    )
-                )
+                mod_logger.info("Pushing image %s with tag %s", im["name"], im["tag"])
 
-                for line in cli.push(
-                    repository=self.repo_uri, tag=im["tag"], stream=True
-                ):
-                    mod_logger.debug(line)
+                _drain_stream(
+                    cli.push(repository=self.repo_uri, tag=im["tag"], stream=True)
+                )
 
             self._repo_uri = self._repo_uri + ":" + self.images[-1]["tag"]
 
@@ -904,22 +908,22 @@ class DockerImage(aws.NamedObject):
 
         if self._clobber_script:
             os.remove(self.script_path)
-            mod_logger.info("Removed {path:s}".format(path=self.script_path))
+            mod_logger.info("Removed %s", self.script_path)
 
         os.remove(self.docker_path)
-        mod_logger.info("Removed {path:s}".format(path=self.docker_path))
+        mod_logger.info("Removed %s", self.docker_path)
         os.remove(self.req_path)
-        mod_logger.info("Removed {path:s}".format(path=self.req_path))
+        mod_logger.info("Removed %s", self.req_path)
 
         try:
             os.rmdir(self.build_path)
-            mod_logger.info("Removed {path:s}".format(path=self.build_path))
+            mod_logger.info("Removed %s", self.build_path)
         except OSError:
             # Directory is not empty. There's pre-existing stuff in there
             # that we shouldn't mess with.
             pass
 
-        cli = docker.from_env().images
+        cli = _docker_client().images
         # Get local images first (lol stands for list_of_lists)
         local_image_lol = [im.tags for im in cli.list()]
         # Flatten the list of lists
@@ -946,17 +950,11 @@ class DockerImage(aws.NamedObject):
                 cli.remove(image=self.repo_uri, force=True, noprune=False)
 
         # Remove from the config file
-        config_file = get_config_file()
-        config = configparser.ConfigParser()
-
         with rlock:
-            config.read(config_file)
+            config = read_config()
             config.remove_section("docker-image " + self.name)
-            with open(config_file, "w") as f:
-                config.write(f)
+            write_config(config)
 
         self._clobbered = True
 
-        mod_logger.info(
-            "Removed local docker images " "{images!s}".format(images=self.images)
-        )
+        mod_logger.info("Removed local docker images %s", self.images)
@@ -25,12 +25,14 @@ import botocore
 import cloudknot as ck
 import configparser
 import errno
+import json
 import os
 import os.path as op
 import pytest
 import shutil
 import tempfile
 import tenacity
+import time
 import uuid
 from moto import mock_batch, mock_cloudformation, mock_ec2, mock_ecr
 from moto import mock_ecs, mock_iam, mock_s3
@@ -210,6 +212,54 @@ def test_get_tags(aws_credentials):
         ck.aws.get_tags(name=name, additional_tags={"Value": 42})
 
 
+def test_bucket_policy_json():
+    from cloudknot.aws.base_classes import _bucket_policy_json
+
+    for bucket in ["cloudknot-test-bucket", "bucket.with.dots"]:
+        ref = json.dumps(ck.aws.base_classes.bucket_policy_document(bucket))
+        assert _bucket_policy_json(bucket) == ref
+
+
+@mock_all
+def test_set_s3_params_keeps_user_tags(bucket_cleanup):
+    ck.refresh_clients()
+    old_params = ck.get_s3_params()
+    s3 = ck.aws.clients["s3"]
+    bucket = get_testing_name()
+
+    try:
+        if ck.get_region() == "us-east-1":
+            s3.create_bucket(Bucket=bucket)
+        else:
+            s3.create_bucket(
+                Bucket=bucket,
+                CreateBucketConfiguration={"LocationConstraint": ck.get_region()},
+            )
+
+        s3.put_bucket_tagging(
+            Bucket=bucket,
+            Tagging={
+                "TagSet": [
+                    {"Key": "team", "Value": "imaging"},
+                    {"Key": "Owner", "Value": "someone-else"},
+                ]
+            },
+        )
+
+        ck.set_s3_params(bucket=bucket)
+
+        tags = {
+            t["Key"]: t["Value"] for t in s3.get_bucket_tagging(Bucket=bucket)["TagSet"]
+        }
+        assert tags["team"] == "imaging"
+        assert tags["Owner"] == ck.aws.get_user()
+        assert tags["Project"] == "Cloudknot global config"
+    finally:
+        ck.set_s3_params(
+            bucket=old_params.bucket, policy=old_params.policy, sse=old_params.sse
+        )
+
+
 @mock_all
 def test_get_region(bucket_cleanup):
     ck.refresh_clients()
@@ -350,11 +400,17 @@ def test_set_region(bucket_cleanup):
 
             assert ck.get_region() == region
 
-            for service, client in ck.aws.clients.items():
+            services = ["batch", "cloudformation", "ecr", "ecs", "ec2", "iam", "s3"]
+            for service in services:
+                client = ck.aws.clients[service]
                 if service == "iam":
                     assert client.meta.region_name == "aws-global"
                 else:
                     assert client.meta.region_name == region
+
+            # The mapping covers every service, built or not
+            assert sorted(ck.aws.clients) == sorted(services)
+            assert all(s in ck.aws.clients for s in services)
     finally:
         ck.set_region(old_region)
         if old_config_file:
@@ -562,8 +618,24 @@ def test_DockerRepo(bucket_cleanup):
 
         assert name in config.options(repo_section_name)
 
+        # A second lookup reuses the cached repo info
+        assert any(key[2] == name for key in ck.aws.ecr._repo_info_cache)
+        dr_again = ck.aws.DockerRepo(name=name)
+        assert dr_again.repo_uri == repo_uri
+
+        # Once the cached entry expires, a repo deleted outside of cloudknot
+        # is looked up again and recreated
+        cache = ck.aws.ecr._repo_info_cache
+        for key in [k for k in cache if k[2] == name]:
+            cache[key] = (time.monotonic() - ck.aws.ecr._REPO_CACHE_TTL, cache[key][1])
+
+        ecr.delete_repository(repositoryName=name, force=True)
+        ck.aws.DockerRepo(name=name)
+        ecr.describe_repositories(repositoryNames=[name])
+
         # Clobber the docker repo
         dr.clobber()
+        assert not any(key[2] == name for key in ck.aws.ecr._repo_info_cache)
 
         retry = tenacity.Retrying(
             wait=tenacity.wait_exponential(max=16),
@@ -702,6 +774,80 @@ def test_DockerRepo(bucket_cleanup):
         raise e
 
 
+@mock_all
+def test_refresh_clients(bucket_cleanup):
+    from cloudknot.aws.base_classes import _get_session, _refresh_clients
+
+    ck.refresh_clients()
+    iam = ck.aws.clients["iam"]
+
+    # Keeping the profile, region and pool size keeps the client ...
+    _refresh_clients()
+    assert ck.aws.clients["iam"] is iam
+
+    # ... but the public refresh rebuilds everything, so that new
+    # credentials are picked up
+    ck.refresh_clients()
+    assert _get_session.cache_info().currsize == 0
+    assert ck.aws.clients["iam"] is not iam
+
+
+@mock_all
+def test_get_job_def(bucket_cleanup):
+    from cloudknot.aws.batch import _get_job_def, _job_def_cache
+
+    ck.refresh_clients()
+    batch = ck.aws.clients["batch"]
+    response = batch.register_job_definition(
+        jobDefinitionName=get_testing_name(),
+        type="container",
+        containerProperties={
+            "image": "busybox",
+            "vcpus": 1,
+            "memory": 32,
+            "environment": [{"name": "CLOUDKNOT_JOBS_S3_BUCKET", "value": "b"}],
+        },
+        retryStrategy={"attempts": 3},
+    )
+    arn = response["jobDefinitionArn"]
+
+    job_def = _get_job_def(arn)
+    assert job_def.arn == arn
+    assert job_def.output_bucket == "b"
+    assert job_def.retries == 3
+    assert _job_def_cache[arn] is job_def
+
+    # A second lookup is served from the cache
+    batch.deregister_job_definition(jobDefinition=arn)
+    assert _get_job_def(arn) is job_def
+
+    ck.refresh_clients()
+    assert arn not in _job_def_cache
+
+
+@mock_all
+def test_StatusPoller(bucket_cleanup):
+    from concurrent.futures import ThreadPoolExecutor
+    from cloudknot.aws.batch import _StatusPoller
+
+    ck.refresh_clients()
+    poller = _StatusPoller(interval=0.1)
+
+    # Unknown job IDs are described together and come back as None
+    with ThreadPoolExecutor(4) as e:
+        results = list(e.map(poller.poll, ["job-{0:d}".format(i) for i in range(4)]))
+
+    assert results == [None] * 4
+
+    # The polling thread exits once nobody is waiting
+    for _ in range(20):
+        if poller._thread is None:
+            break
+        time.sleep(0.1)
+
+    assert poller._thread is None
+
+
 # def test_BatchJob(pars):
 #     """Test only the input validation of BatchJob.
 #
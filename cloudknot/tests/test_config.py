@@ -96,6 +96,90 @@ def test_add_remove_verify(configured):
     assert aws_config == "[aws]\nconfigured = True\n\n"
 
 
+def test_read_write_config(configured):
+    temp_name = configured
+
+    config = ck.config.read_config()
+    assert config.get("aws", "configured") == "True"
+
+    # Unchanged file returns the cached parser
+    assert ck.config.read_config() is config
+
+    config.set("aws", "test-option", "test-value")
+    ck.config.write_config(config)
+    assert ck.config.read_config() is config
+
+    # External writes to the config file invalidate the cache
+    with open(temp_name, "w") as f:
+        f.write("[aws]\nconfigured = False\n")
+
+    config = ck.config.read_config()
+    assert config.get("aws", "configured") == "False"
+    assert not config.has_option("aws", "test-option")
+
+
+def test_batch_writes(configured):
+    temp_name = configured
+
+    with ck.config.batch_writes():
+        ck.config.add_resource("test-section-0", "test-option-0", "test-value")
+        ck.config.add_resource("test-section-0", "test-option-1", "test-value")
+        ck.config.add_resource("test-section-1", "test-option-0", "test-value")
+
+        # Nothing is written until the block exits
+        with open(temp_name, "r") as fp:
+            assert "test-section-0" not in fp.read()
+
+        config = ck.config.read_config()
+        assert config.get("test-section-1", "test-option-0") == "test-value"
+
+    ref_cfg = os.path.join(data_path, "config_ref_data", "test_add_resource.cfg")
+    assert filecmp.cmp(temp_name, ref_cfg, shallow=False)
+
+
+class FailingConfigParser(configparser.ConfigParser):
+    def write(self, fp, space_around_delimiters=True):
+        raise OSError("disk full")
+
+
+def test_write_config_failure(configured):
+    temp_name = configured
+
+    config = ck.config.read_config()
+    config.set("aws", "test-option", "test-value")
+
+    failing = FailingConfigParser()
+    failing.read_dict(config)
+    with pytest.raises(OSError):
+        ck.config.write_config(failing)
+
+    # The unsaved edit is dropped and the file is left untouched
+    config = ck.config.read_config()
+    assert not config.has_option("aws", "test-option")
+    with open(temp_name, "r") as fp:
+        assert fp.read() == "[aws]\nconfigured = True\n\n"
+    assert not [f for f in os.listdir(op.dirname(temp_name)) if f.endswith(".tmp")]
+
+
+def test_batch_writes_failure(configured):
+    temp_name = configured
+
+    with pytest.raises(ValueError):
+        with ck.config.batch_writes():
+            ck.config.add_resource("test-section-0", "test-option-0", "test-value")
+            with ck.config.batch_writes():
+                ck.config.add_resource("test-section-1", "test-option-0", "test-value")
+            raise ValueError
+
+    # Pending changes are discarded rather than written
+    with open(temp_name, "r") as fp:
+        assert "test-section" not in fp.read()
+
+    config = ck.config.read_config()
+    assert not config.has_section("test-section-0")
+    assert not config.has_section("test-section-1")
+
+
 @mock_all
 def test_is_valid_stack(configured, aws_credentials):
     ck.refresh_clients()
@@ -293,6 +293,44 @@ def test_knot(cleanup_repos):
         raise e
 
 
+@mock_all
+def test_knot_clobber_keeps_pars(cleanup_repos):
+    ck.refresh_clients()
+    pars = ck.Pars(name=get_testing_name())
+
+    try:
+        # Building a real Knot requires docker, so assemble one around an
+        # existing stack. clobber() only needs the stack, pars and jobs.
+        cf = ck.aws.clients["cloudformation"]
+        name = get_testing_name()
+        stack_id = cf.create_stack(
+            StackName=name + "-knot",
+            TemplateBody='{"Resources": {"B": {"Type": "AWS::S3::Bucket"}}}',
+        )["StackId"]
+
+        knot = ck.Knot.__new__(ck.Knot)
+        ck.aws.NamedObject.__init__(knot, name=name)
+        knot._knot_name = "knot " + name
+        knot._stack_id = stack_id
+        knot._pars = pars
+        knot._jobs = []
+
+        knot.clobber()
+        assert knot.clobbered
+
+        # The default clobber must leave the PARS stack and config alone
+        response = cf.describe_stacks(StackName=pars.stack_id)
+        assert response["Stacks"][0]["StackStatus"] == "CREATE_COMPLETE"
+        assert not pars.clobbered
+
+        config = configparser.ConfigParser()
+        with ck.config.rlock:
+            config.read(ck.config.get_config_file())
+        assert pars.pars_name in config.sections()
+    finally:
+        pars.clobber()
+
+
 @mock_all
 def test_knot_errors(cleanup_repos):
     ck.refresh_clients()